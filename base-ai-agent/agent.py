@@ -4,10 +4,136 @@ from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.function_tool import FunctionTool
 from a2a.client import A2AClient
+import atexit
 import httpx
 import asyncio
+import logging
 import os
 import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# Network failures we translate into user-facing error strings; anything
+# else (including CancelledError) propagates to the caller
+_A2A_ERRORS = (httpx.HTTPError, asyncio.TimeoutError, ConnectionError, OSError)
+
+# Shared HTTP clients so A2A calls reuse pooled keep-alive connections instead
+# of paying a fresh TCP + TLS handshake on every request. Created lazily on
+# first use so they bind to the running event loop.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_search_client: httpx.AsyncClient = None
+_scrape_client: httpx.AsyncClient = None
+
+def _new_async_client(timeout: float) -> httpx.AsyncClient:
+    """Build a pooled client, negotiating HTTP/2 when the h2 package is present."""
+    try:
+        return httpx.AsyncClient(timeout=timeout, limits=_HTTP_LIMITS, http2=True)
+    except ImportError:
+        # h2 not installed - HTTP/1.1 keep-alive still reuses sockets
+        return httpx.AsyncClient(timeout=timeout, limits=_HTTP_LIMITS)
+
+def _get_search_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for search agent calls (30s timeout)."""
+    global _search_client
+    if _search_client is None:
+        _search_client = _new_async_client(timeout=30.0)
+    return _search_client
+
+def _get_scrape_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for scraper agent calls (60s timeout)."""
+    global _scrape_client
+    if _scrape_client is None:
+        _scrape_client = _new_async_client(timeout=60.0)
+    return _scrape_client
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients. Called automatically at shutdown."""
+    global _search_client, _scrape_client
+    for client in (_search_client, _scrape_client):
+        if client is not None:
+            await client.aclose()
+    _search_client = None
+    _scrape_client = None
+    _a2a_clients.clear()
+
+def _close_http_clients_at_exit() -> None:
+    try:
+        asyncio.run(close_http_clients())
+    except Exception:
+        pass  # Interpreter is shutting down; nothing useful to do
+
+atexit.register(_close_http_clients_at_exit)
+
+# Resolved A2A clients keyed by agent base URL. The agent card at
+# /.well-known/agent.json is immutable for the lifetime of the process, so
+# fetching and parsing it once per agent is enough.
+_a2a_clients: dict = {}
+_a2a_clients_lock: asyncio.Lock = None
+
+async def _get_a2a_client(base_url: str, httpx_client: httpx.AsyncClient) -> A2AClient:
+    """Get (or create and cache) the A2A client for an agent base URL."""
+    global _a2a_clients_lock
+    if _a2a_clients_lock is None:
+        _a2a_clients_lock = asyncio.Lock()
+
+    if base_url not in _a2a_clients:
+        # Lock so a burst of concurrent calls triggers only one card fetch
+        async with _a2a_clients_lock:
+            if base_url not in _a2a_clients:
+                _a2a_clients[base_url] = await A2AClient.get_client_from_agent_card_url(
+                    httpx_client=httpx_client,
+                    base_url=base_url,
+                    agent_card_path='/.well-known/agent.json'
+                )
+    return _a2a_clients[base_url]
+
+# Bound on concurrent per-URL scrape requests sent to the Web Scraper Agent
+_SCRAPE_CONCURRENCY = 5
+
+# Pre-compiled URL extraction pattern; match length is capped so degenerate
+# search blobs cannot make the matcher do unbounded work per URL
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]{1,2048}')
+
+# Agent endpoints, bound once at import - env vars do not change mid-process
+SEARCH_AGENT_BASE_URL = os.getenv('GOOGLE_SEARCH_AGENT_URL', 'http://localhost:8001')
+SCRAPER_AGENT_BASE_URL = os.getenv('WEB_SCRAPER_AGENT_URL', 'http://localhost:8002')
+
+def _extract_from_messages(response) -> str:
+    """Extract text from a messages-list style response."""
+    # Single join instead of quadratic += concatenation over long payloads
+    return "".join(
+        getattr(msg, 'content', None) or getattr(msg, 'text', '')
+        for msg in response.messages
+    )
+
+def _resolve_extractor(response):
+    """Pick the extraction strategy for a response's format (once per type)."""
+    if isinstance(response, str):
+        return lambda r: r
+    if getattr(response, 'content', None):
+        return lambda r: r.content
+    if getattr(response, 'text', None):
+        return lambda r: r.text
+    if getattr(response, 'choices', None):
+        # OpenAI-style response
+        return lambda r: r.choices[0].message.content
+    if getattr(response, 'messages', None):
+        return _extract_from_messages
+    # Last resort - convert to string
+    return str
+
+# Chosen extractor per response class, so after the first response of a
+# given type extraction is a single dict lookup instead of a hasattr ladder
+_EXTRACTORS: dict = {}
+
+def _extract_response_text(response) -> str:
+    """Extract text content from an A2A response - handle different response formats."""
+    extractor = _EXTRACTORS.get(type(response))
+    if extractor is None:
+        extractor = _resolve_extractor(response)
+        _EXTRACTORS[type(response)] = extractor
+    return extractor(response) or str(response)
 
 # Base instruction with intelligent search capability
 BASE_INSTRUCTION = """You are a helpful AI assistant with access to current web information.
@@ -33,8 +159,83 @@ Response Format Rules:
 - Never mention tool names like "web_search" or "base_ai_agent_response" in your responses
 - For greetings, respond immediately with something like "Hello! How can I help you today?\""""
 
-async def web_search(query: str) -> str:
+# Bounded TTL cache of completed search/scrape results: key -> (expiry, value).
+# Insertion order doubles as the LRU order; hits are re-inserted to stay hot.
+_RESULT_CACHE_MAX = 256
+_RESULT_CACHE_TTL = 300.0  # seconds
+_result_cache: dict = {}
+
+def _cache_get(key):
+    """Return a cached value, or None if missing or expired."""
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        del _result_cache[key]
+        return None
+    # Refresh recency so frequently hit entries survive eviction
+    del _result_cache[key]
+    _result_cache[key] = entry
+    return entry[1]
+
+def _cache_put(key, value) -> None:
+    """Store a value, evicting the least recently used entry when full."""
+    if key in _result_cache:
+        del _result_cache[key]
+    elif len(_result_cache) >= _RESULT_CACHE_MAX:
+        del _result_cache[next(iter(_result_cache))]
+    _result_cache[key] = (time.monotonic() + _RESULT_CACHE_TTL, value)
+
+# In-flight web_search calls keyed by query, so concurrent duplicate
+# requests share a single search + scrape round trip
+_inflight_searches: dict = {}
+
+# Trivial queries that should never trigger a search; the instruction tells
+# the LLM not to call the tool for these, but guard against mis-calls anyway
+_TRIVIAL_QUERIES = frozenset({
+    "hi", "hello", "hey", "how are you", "thanks", "thank you", "ok",
+})
+
+async def web_search(query: str, no_cache: bool = False) -> str:
     """Search the web for current information and scrape relevant content automatically."""
+    # Short-circuit greetings/acknowledgements before any A2A round trip
+    stripped = query.strip().lower()
+    if len(stripped) < 3 or stripped in _TRIVIAL_QUERIES:
+        return ""
+
+    if not no_cache:
+        cached = _cache_get(query)
+        if cached is not None:
+            return cached
+
+    fut = _inflight_searches.get(query)
+    if fut is not None:
+        # An identical search is already running - wait for its result
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight_searches[query] = fut
+    try:
+        result = await _web_search_impl(query)
+        fut.set_result(result)
+        if not result.startswith("❌"):  # Don't cache failures
+            _cache_put(query, result)
+        return result
+    except asyncio.CancelledError:
+        # Only the leader was cancelled; waiters see the cancellation too
+        fut.cancel()
+        raise
+    except BaseException as e:
+        # Hand waiters the real failure; cancelling the future here would
+        # surface a bogus CancelledError in tasks that were never cancelled
+        fut.set_exception(e)
+        fut.exception()  # Mark retrieved in case no waiter is attached
+        raise
+    finally:
+        _inflight_searches.pop(query, None)
+
+async def _web_search_impl(query: str) -> str:
+    """Run the actual search + scrape pipeline for a query."""
     try:
         # Step 1: Perform Google search
         search_result = await _search_google_internal(query)
@@ -52,179 +253,101 @@ async def web_search(query: str) -> str:
         combined_result = f"{search_result}\n\n🌐 **Detailed Content Analysis:**\n\n{scrape_result}"
         
         return combined_result
-        
-    except Exception as e:
-        return f"❌ Search failed: {str(e)}. Unable to retrieve current information from the web."
+
+    except _A2A_ERRORS as e:
+        logger.warning("web_search failed for query %r", query, exc_info=True)
+        return f"❌ Search failed: {type(e).__name__}. Unable to retrieve current information from the web."
 
 async def _search_google_internal(query: str) -> str:
     """Internal function to search Google using the Google Search Agent via A2A protocol."""
     try:
-        # Get the Google Search Agent URL from environment
-        search_agent_base_url = os.getenv('GOOGLE_SEARCH_AGENT_URL', 'http://localhost:8001')
-        
-        async with httpx.AsyncClient(timeout=30.0) as httpx_client:
-            # Create A2A client from agent card
-            a2a_client = await A2AClient.get_client_from_agent_card_url(
-                httpx_client=httpx_client,
-                base_url=search_agent_base_url,
-                agent_card_path='/.well-known/agent.json'
-            )
-            
-            # Send search request to the Google Search Agent
-            response = await a2a_client.send_message(query)
-            
-            # Extract content from A2A response - handle different response formats
-            if hasattr(response, 'content') and response.content:
-                return response.content
-            elif hasattr(response, 'text') and response.text:
-                return response.text
-            elif isinstance(response, str):
-                return response
-            elif hasattr(response, 'choices') and response.choices:
-                # Handle OpenAI-style response
-                return response.choices[0].message.content
-            elif hasattr(response, 'messages') and response.messages:
-                # Handle messages list
-                content = ""
-                for msg in response.messages:
-                    if hasattr(msg, 'content'):
-                        content += msg.content
-                    elif hasattr(msg, 'text'):
-                        content += msg.text
-                return content
-            else:
-                # Last resort - convert to string
-                return str(response)
-        
-    except Exception as e:
-        return f"❌ Search failed: {str(e)}. Make sure the Google Search Agent is running on port 8001."
+        # Reuse the cached A2A client (one agent-card fetch per process)
+        a2a_client = await _get_a2a_client(SEARCH_AGENT_BASE_URL, _get_search_client())
+
+        # Send search request to the Google Search Agent
+        response = await a2a_client.send_message(query)
+
+        return _extract_response_text(response)
+
+    except _A2A_ERRORS as e:
+        logger.warning("Google Search Agent call failed", exc_info=True)
+        return f"❌ Search failed: {type(e).__name__}. Make sure the Google Search Agent is running on port 8001."
 
 async def _scrape_urls_internal(urls: list) -> str:
     """Scrape URLs using the Web Scraper Agent via A2A protocol."""
+    cache_key = ('scrape', tuple(sorted(urls)))
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Get the Web Scraper Agent URL from environment
-        scraper_agent_base_url = os.getenv('WEB_SCRAPER_AGENT_URL', 'http://localhost:8002')
-        
-        async with httpx.AsyncClient(timeout=60.0) as httpx_client:  # Longer timeout for scraping
-            # Create A2A client from agent card
-            a2a_client = await A2AClient.get_client_from_agent_card_url(
-                httpx_client=httpx_client,
-                base_url=scraper_agent_base_url,
-                agent_card_path='/.well-known/agent.json'
-            )
-            
-            # Send scraping request with URLs
-            urls_text = "Scrape these URLs:\n" + "\n".join(urls)
-            response = await a2a_client.send_message(urls_text)
-            
-            # Extract content from A2A response - handle different response formats
-            if hasattr(response, 'content') and response.content:
-                return response.content
-            elif hasattr(response, 'text') and response.text:
-                return response.text
-            elif isinstance(response, str):
-                return response
-            elif hasattr(response, 'choices') and response.choices:
-                # Handle OpenAI-style response
-                return response.choices[0].message.content
-            elif hasattr(response, 'messages') and response.messages:
-                # Handle messages list
-                content = ""
-                for msg in response.messages:
-                    if hasattr(msg, 'content'):
-                        content += msg.content
-                    elif hasattr(msg, 'text'):
-                        content += msg.text
-                return content
-            else:
-                # Last resort - convert to string
-                return str(response)
-        
-    except Exception as e:
-        return f"❌ Web scraping failed: {str(e)}. Make sure the Web Scraper Agent is running on port 8002."
+        # Reuse the cached A2A client (one agent-card fetch per process)
+        a2a_client = await _get_a2a_client(SCRAPER_AGENT_BASE_URL, _get_scrape_client())
+
+        # Fan the URLs out concurrently instead of one combined sequential
+        # request, so total latency is ~one scrape instead of N scrapes
+        semaphore = asyncio.Semaphore(_SCRAPE_CONCURRENCY)
+
+        async def _send_single(url: str) -> str:
+            async with semaphore:
+                # Send the bare URL - the scraper extracts URLs by pattern,
+                # so any surrounding prose is just extra parsing work for it
+                response = await a2a_client.send_message(url)
+                return _extract_response_text(response)
+
+        results = await asyncio.gather(*[_send_single(url) for url in urls])
+        combined = "\n\n".join(results)
+        _cache_put(cache_key, combined)
+        return combined
+
+    except _A2A_ERRORS as e:
+        logger.warning("Web Scraper Agent call failed", exc_info=True)
+        return f"❌ Web scraping failed: {type(e).__name__}. Make sure the Web Scraper Agent is running on port 8002."
 
 def _extract_urls_from_search_result(search_result: str) -> list:
-    """Extract URLs from search result text."""
-    urls = []
-    
-    # Look for URLs in the search result
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    found_urls = re.findall(url_pattern, search_result)
-    
-    # Also look for SCRAPABLE_URLS section
-    if "SCRAPABLE_URLS:" in search_result:
-        lines = search_result.split("SCRAPABLE_URLS:")[1].strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if line and line.startswith('http'):
-                urls.append(line)
-    
-    # Remove duplicates and limit to top 3
-    unique_urls = list(dict.fromkeys(found_urls + urls))[:3]
-    
-    return unique_urls
+    """Extract up to three unique URLs from search result text."""
+    # Single scan that stops as soon as three unique URLs are collected.
+    # URLs listed under the SCRAPABLE_URLS marker are plain http(s) lines,
+    # so the same pattern picks them up without a separate section pass.
+    seen = {}
+    for match in _URL_RE.finditer(search_result):
+        url = match.group(0)
+        if url not in seen:
+            seen[url] = None
+            if len(seen) == 3:
+                break
 
-async def _scrape_urls(urls: list) -> str:
-    """Scrape URLs using the Web Scraper Agent via A2A protocol."""
-    try:
-        # Get the Web Scraper Agent URL from environment
-        scraper_agent_base_url = os.getenv('WEB_SCRAPER_AGENT_URL', 'http://localhost:8002')
-        
-        async with httpx.AsyncClient(timeout=60.0) as httpx_client:  # Longer timeout for scraping
-            # Create A2A client from agent card
-            a2a_client = await A2AClient.get_client_from_agent_card_url(
-                httpx_client=httpx_client,
-                base_url=scraper_agent_base_url,
-                agent_card_path='/.well-known/agent.json'
-            )
-            
-            # Send scraping request with URLs
-            urls_text = "Scrape these URLs:\n" + "\n".join(urls)
-            response = await a2a_client.send_message(urls_text)
-            
-            # Extract content from A2A response - handle different response formats
-            if hasattr(response, 'content') and response.content:
-                return response.content
-            elif hasattr(response, 'text') and response.text:
-                return response.text
-            elif isinstance(response, str):
-                return response
-            elif hasattr(response, 'choices') and response.choices:
-                # Handle OpenAI-style response
-                return response.choices[0].message.content
-            elif hasattr(response, 'messages') and response.messages:
-                # Handle messages list
-                content = ""
-                for msg in response.messages:
-                    if hasattr(msg, 'content'):
-                        content += msg.content
-                    elif hasattr(msg, 'text'):
-                        content += msg.text
-                return content
-            else:
-                # Last resort - convert to string
-                return str(response)
-        
-    except Exception as e:
-        return f"❌ Web scraping failed: {str(e)}. Make sure the Web Scraper Agent is running on port 8002."
+    return list(seen)
+
+# Public-facing alias kept for callers/tests that used the old name; the
+# implementation lives in _scrape_urls_internal to avoid a second copy.
+_scrape_urls = _scrape_urls_internal
+
+# Shared LiteLLM model for Ollama, created once and reused by every agent
+# instance so repeated create_base_agent calls do not build duplicate clients
+_litellm_model = None
+
+def _get_litellm_model() -> LiteLlm:
+    """Get the shared LiteLlm model, creating it on first use."""
+    global _litellm_model
+    if _litellm_model is None:
+        _litellm_model = LiteLlm(
+            model="ollama_chat/llama3.1:8b",
+            api_base="http://localhost:11434",
+            temperature=0.7,
+            max_tokens=2048,
+        )
+    return _litellm_model
 
 def create_base_agent() -> Agent:
     """Create a base agent with intelligent web search capabilities."""
-    
-    # Configure LiteLLM for Ollama
-    litellm_model = LiteLlm(
-        model="ollama_chat/llama3.1:8b",
-        api_base="http://localhost:11434",
-        temperature=0.7,
-        max_tokens=2048,
-    )
-    
+
     # Create tool for web search
     web_search_tool = FunctionTool(web_search)
     
     # Create the main agent with web search capability
     agent = Agent(
-        model=litellm_model,
+        model=_get_litellm_model(),
         name="base_ai_agent",
         description="A conversational AI assistant with intelligent web search capabilities",
         instruction=BASE_INSTRUCTION,
@@ -233,5 +356,20 @@ def create_base_agent() -> Agent:
     
     return agent
 
-# Create the root agent for ADK
-root_agent = create_base_agent()
+# Root agent singleton, built lazily so importing this module for its search
+# helpers does not construct the LiteLlm model and tools as a side effect
+_root_agent = None
+
+def get_root_agent() -> Agent:
+    """Get the root agent, creating it on first use."""
+    global _root_agent
+    if _root_agent is None:
+        _root_agent = create_base_agent()
+    return _root_agent
+
+def __getattr__(name: str):
+    # Keep the `root_agent` module attribute that ADK discovers (PEP 562)
+    # while deferring agent construction until it is actually requested
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,68 +1,72 @@
 """Base AI Agent - Main conversational agent with memory and Ollama integration."""
 
+import functools
+import logging
 import sys
 import os
 import time
-import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Dict, Any
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from google.adk import Agent
 from google.adk.models.lite_llm import LiteLlm
-from google.adk.models.llm_request import LlmRequest
-from google.adk.models.llm_response import LlmResponse
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
-from pydantic import BaseModel
 
 # Import our shared utilities
 from shared.memory_manager import (
     get_memory_manager,
-    create_memory_context_instruction,
     extract_user_info_from_memory,
 )
 from shared.ollama_config import get_ollama_config, check_ollama_status
 from shared.utils import (
     setup_logging,
-    generate_session_id,
-    sanitize_input,
-    create_response_metadata,
-    Timer,
     format_timestamp,
 )
 from config import (
     get_agent_config,
-    get_instruction_template,
     BASE_INSTRUCTION,
-    ERROR_MESSAGES,
-    SUCCESS_MESSAGES,
     validate_config,
 )
 
-# Set up logging
-logger = setup_logging()
+# Module logger; full handler configuration happens lazily in _setup()
+logger = logging.getLogger(__name__)
 
-# Initialize configurations
-config = get_agent_config()
-ollama_config = get_ollama_config()
-memory_manager = get_memory_manager()
+# Lazy singletons so importing this module (e.g. from tests or tools that
+# only need one helper) does not pay config building, memory loading from
+# disk, or logging file-handler setup up front
 
-# Setup Ollama environment
-ollama_config.setup_environment()
+
+@functools.cache
+def _get_config() -> Dict[str, Any]:
+    return get_agent_config()
+
+
+@functools.cache
+def _get_ollama_config():
+    ollama_config = get_ollama_config()
+    ollama_config.setup_environment()
+    return ollama_config
+
+
+@functools.cache
+def _get_memory_manager():
+    return get_memory_manager()
 
 
 # Custom tools for the base agent
 def get_agent_status(tool_context: ToolContext) -> Dict[str, Any]:
     """Get comprehensive status of the AI agent system."""
+    config = _get_config()
 
     # Check Ollama status
     ollama_status = check_ollama_status()
 
     # Get memory statistics
-    memory_stats = memory_manager.get_memory_stats()
+    memory_stats = _get_memory_manager().get_memory_stats()
 
     # Get configuration validation
     config_validation = validate_config()
@@ -94,7 +98,7 @@ def remember_information(information: str, tool_context: ToolContext) -> str:
         session_id = getattr(tool_context, "session_id", "default_session")
 
         # Save to memory
-        memory_manager.add_interaction(
+        _get_memory_manager().add_interaction(
             user_message=f"User wants to remember: {information}",
             assistant_response=f"I've saved this information: {information}",
             session_id=session_id,
@@ -111,23 +115,20 @@ def remember_information(information: str, tool_context: ToolContext) -> str:
 def search_my_memory(query: str, tool_context: ToolContext) -> str:
     """Search through conversation memory for relevant information."""
     try:
-        relevant_memories = memory_manager.search_memory(query, limit=5)
+        relevant_memories = _get_memory_manager().search_memory(query, limit=5)
 
         if not relevant_memories:
             return f"I don't have any relevant memories about '{query}'. This might be the first time we've discussed this topic."
 
-        memory_results = []
-        for memory in relevant_memories:
-            memory_results.append(
-                f"From our conversation on {format_timestamp(memory.timestamp)}:"
-            )
-            memory_results.append(f"User: {memory.user_message}")
-            memory_results.append(f"Me: {memory.assistant_response}")
-            memory_results.append("---")
-
-        return f"Here's what I found in my memory about '{query}':\n\n" + "\n".join(
-            memory_results
+        parts = [f"Here's what I found in my memory about '{query}':\n"]
+        parts.extend(
+            f"From our conversation on {memory.formatted_ts}:\n"
+            f"User: {memory.user_message}\n"
+            f"Me: {memory.assistant_response}\n"
+            "---"
+            for memory in relevant_memories
         )
+        return "\n".join(parts)
 
     except Exception as e:
         logger.error(f"Error searching memory: {e}")
@@ -138,7 +139,7 @@ def get_user_profile(tool_context: ToolContext) -> str:
     """Get information about the user from conversation history."""
     try:
         session_id = getattr(tool_context, "session_id", "default_session")
-        user_info = extract_user_info_from_memory(memory_manager, session_id)
+        user_info = extract_user_info_from_memory(_get_memory_manager(), session_id)
 
         profile_parts = []
 
@@ -170,7 +171,7 @@ def clear_my_memory(tool_context: ToolContext) -> str:
     """Clear the current session memory (not persistent memory)."""
     try:
         session_id = getattr(tool_context, "session_id", "default_session")
-        memory_manager.clear_session_memory(session_id)
+        _get_memory_manager().clear_session_memory(session_id)
         return "I've cleared my memory for this session. My persistent memory across sessions remains intact."
 
     except Exception as e:
@@ -185,52 +186,8 @@ def clear_my_memory(tool_context: ToolContext) -> str:
 #     pass
 
 # async def after_agent_callback(callback_context: Any) -> None:
-#     """Called after the agent generates a response.""" 
+#     """Called after the agent generates a response."""
 #     pass
-    """Called after the agent generates a response."""
-    try:
-        session_id = callback_context._invocation_context.session.id
-
-        # Get the latest user message and agent response
-        events = callback_context._invocation_context.session.events
-
-        user_message = ""
-        agent_response = ""
-
-        # Find the latest user message and agent response
-        for event in reversed(events):
-            if event.content:
-                if event.content.role == "user" and not user_message:
-                    user_message = (
-                        event.content.parts[0].text if event.content.parts else ""
-                    )
-                elif event.content.role == "model" and not agent_response:
-                    agent_response = (
-                        event.content.parts[0].text if event.content.parts else ""
-                    )
-
-                if user_message and agent_response:
-                    break
-
-        # Save to memory if we have both messages
-        if user_message and agent_response:
-            memory_enhanced = callback_context.state.get("memory_enhanced", False)
-
-            memory_manager.add_interaction(
-                user_message=sanitize_input(user_message),
-                assistant_response=sanitize_input(agent_response),
-                session_id=session_id,
-                metadata={
-                    "memory_enhanced": memory_enhanced,
-                    "timestamp": time.time(),
-                    "agent_version": config["agent"]["version"],
-                },
-            )
-
-            logger.debug(f"Saved interaction to memory for session {session_id}")
-
-    except Exception as e:
-        logger.error(f"Error in after_agent_callback: {e}")
 
 
 # Initialize Google Search Agent (A2A communication)
@@ -242,6 +199,8 @@ logger.info("A2A communication temporarily disabled")
 # Create the main Base AI Agent
 def create_base_ai_agent() -> Agent:
     """Create and configure the base AI agent."""
+    config = _get_config()
+    ollama_config = _get_ollama_config()
 
     # Validate configuration
     validation = validate_config()
@@ -318,36 +277,60 @@ def create_base_ai_agent() -> Agent:
     return agent
 
 
-# Create the agent instance
-try:
-    root_agent = create_base_ai_agent()
+# Root agent singleton, built lazily so importing this module does not pay
+# logging setup, memory loading, the Ollama health probe, or agent creation
+_root_agent = None
 
-    # Log startup information
-    logger.info("=" * 60)
-    logger.info("🤖 Base AI Agent Started Successfully!")
-    logger.info(f"Agent Name: {config['agent']['name']}")
-    logger.info(f"Version: {config['agent']['version']}")
-    logger.info(f"Model: {config['model']['default_model']}")
-    logger.info(f"Web Interface: http://localhost:{config['web']['port']}")
-    logger.info(
-        f"Memory System: {'Enabled' if config['memory']['enable_cross_session'] else 'Disabled'}"
-    )
-    logger.info(
-        f"A2A Communication: {'Enabled' if google_search_agent else 'Disabled'}"
-    )
-    logger.info("=" * 60)
-
-    # Print startup banner
-    from shared.utils import create_startup_banner
-
-    print(create_startup_banner())
-
-except Exception as e:
-    logger.error(f"Failed to create Base AI Agent: {e}")
-    print(f"\n❌ Error: {e}")
-    print("\nPlease check:")
-    print("1. Ollama is running: `ollama list`")
-    print("2. Required model is installed: `ollama pull mistral-small:7b`")
-    print("3. Environment variables are set correctly")
-    print("4. No port conflicts exist")
-    sys.exit(1)
+
+def get_root_agent() -> Agent:
+    """Get the root agent, creating and announcing it on first use."""
+    global _root_agent
+    if _root_agent is not None:
+        return _root_agent
+
+    # Configure logging handlers once, now that we are actually starting
+    setup_logging()
+
+    try:
+        _root_agent = create_base_ai_agent()
+        config = _get_config()
+
+        # Log startup information
+        logger.info("=" * 60)
+        logger.info("🤖 Base AI Agent Started Successfully!")
+        logger.info(f"Agent Name: {config['agent']['name']}")
+        logger.info(f"Version: {config['agent']['version']}")
+        logger.info(f"Model: {config['model']['default_model']}")
+        logger.info(f"Web Interface: http://localhost:{config['web']['port']}")
+        logger.info(
+            f"Memory System: {'Enabled' if config['memory']['enable_cross_session'] else 'Disabled'}"
+        )
+        logger.info(
+            f"A2A Communication: {'Enabled' if google_search_agent else 'Disabled'}"
+        )
+        logger.info("=" * 60)
+
+        # Print startup banner
+        from shared.utils import create_startup_banner
+
+        print(create_startup_banner())
+
+        return _root_agent
+
+    except Exception as e:
+        logger.error(f"Failed to create Base AI Agent: {e}")
+        print(f"\n❌ Error: {e}")
+        print("\nPlease check:")
+        print("1. Ollama is running: `ollama list`")
+        print("2. Required model is installed: `ollama pull mistral-small:7b`")
+        print("3. Environment variables are set correctly")
+        print("4. No port conflicts exist")
+        raise
+
+
+def __getattr__(name: str):
+    # Keep the `root_agent` module attribute (PEP 562) while deferring
+    # construction until it is actually requested
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,10 @@
 """Configuration for the Base AI Agent."""
 
+import functools
 import os
-from typing import Dict, Any
+import string
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Union
 from pathlib import Path
 
 # Get the root directory
@@ -53,6 +56,8 @@ A2A_CONFIG = {
 }
 
 # Ollama Configuration
+# For concurrent request throughput, also consider the Ollama server-side
+# env vars OLLAMA_NUM_PARALLEL and OLLAMA_MAX_LOADED_MODELS.
 OLLAMA_CONFIG = {
     "api_base": os.getenv("OLLAMA_API_BASE", "http://localhost:11434"),
     "health_check_interval": 30,  # seconds
@@ -145,29 +150,51 @@ SUCCESS_MESSAGES = {
 }
 
 
-def get_agent_config() -> Dict[str, Any]:
-    """Get complete agent configuration."""
-    return {
-        "agent": AGENT_CONFIG,
-        "model": MODEL_CONFIG,
-        "memory": MEMORY_CONFIG,
-        "web": WEB_CONFIG,
-        "a2a": A2A_CONFIG,
-        "ollama": OLLAMA_CONFIG,
-        "security": SECURITY_CONFIG,
-        "features": FEATURES,
-    }
-
-
-def get_instruction_template(use_memory: bool = False) -> str:
-    """Get the appropriate instruction template."""
+# Pre-compiled template so per-turn substitution is a single pass instead
+# of a fresh str.format parse of the whole instruction
+MEMORY_ENHANCED_TEMPLATE = string.Template(
+    MEMORY_ENHANCED_INSTRUCTION.replace("{memory_context}", "$memory_context").replace(
+        "{user_message}", "$user_message"
+    )
+)
+
+
+@functools.cache
+def get_agent_config() -> Mapping[str, Any]:
+    """Get complete agent configuration (cached, read-only view)."""
+    return MappingProxyType(
+        {
+            "agent": AGENT_CONFIG,
+            "model": MODEL_CONFIG,
+            "memory": MEMORY_CONFIG,
+            "web": WEB_CONFIG,
+            "a2a": A2A_CONFIG,
+            "ollama": OLLAMA_CONFIG,
+            "security": SECURITY_CONFIG,
+            "features": FEATURES,
+        }
+    )
+
+
+def get_instruction_template(use_memory: bool = False) -> Union[str, string.Template]:
+    """Get the appropriate instruction template.
+
+    With use_memory the pre-compiled Template is returned; callers fill it
+    with .substitute(memory_context=..., user_message=...).
+    """
     if use_memory:
-        return MEMORY_ENHANCED_INSTRUCTION
+        return MEMORY_ENHANCED_TEMPLATE
     return BASE_INSTRUCTION
 
 
+@functools.cache
 def validate_config() -> Dict[str, Any]:
-    """Validate agent configuration."""
+    """Validate agent configuration.
+
+    Cached: configuration is fixed after process start, so the env-var
+    walk runs once. Call validate_config.cache_clear() if the environment
+    is ever mutated at runtime (tests, for example).
+    """
     validation_result = {"valid": True, "errors": [], "warnings": []}
 
     # Check required environment variables
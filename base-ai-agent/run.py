@@ -21,6 +21,15 @@ import os
 # Add the parent directory to the path to import shared modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Use uvloop for the event loop when available (not supported on Windows);
+# the agent's A2A calls are pure asyncio I/O, so this cuts scheduling overhead
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 from base_ai_agent.agent import root_agent
 from shared.utils import logger
 
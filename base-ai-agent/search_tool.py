@@ -1,25 +1,100 @@
 """Google Search tool for the base AI agent."""
 
-import requests
+import asyncio
+import atexit
+import httpx
+import orjson
 import os
-from typing import Dict, Any, List
+import time
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Shared async HTTP client so concurrent searches overlap on the event loop
+# and reuse pooled keep-alive connections (TLS resumption, HTTP/2
+# multiplexing) instead of handshaking per call
+_client = None
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        try:
+            _client = httpx.AsyncClient(timeout=30.0, limits=_LIMITS, http2=True)
+        except ImportError:
+            # h2 not installed - HTTP/1.1 keep-alive still reuses sockets
+            _client = httpx.AsyncClient(timeout=30.0, limits=_LIMITS)
+    return _client
+
+def _close_client_at_exit() -> None:
+    if _client is not None:
+        try:
+            asyncio.run(_client.aclose())
+        except Exception:
+            pass  # Interpreter is shutting down; nothing useful to do
+
+atexit.register(_close_client_at_exit)
+
+# Cached formatted results: (query, num_results) -> (expiry, result). Repeat
+# queries in a session skip the API round trip and do not burn quota.
+_CACHE_MAX = 512
+_CACHE_TTL = 600.0  # seconds
+_search_cache: dict = {}
+
+# In-flight searches, so concurrent identical queries coalesce upstream
+_inflight: dict = {}
+
 async def google_search(query: str, num_results: int = 5) -> str:
     """
     Perform a Google search and return formatted results.
-    
+
     Args:
         query: The search query string
         num_results: Number of results to return (default: 5, max: 10)
-        
+
     Returns:
         Formatted search results as a string
     """
-    
+    cache_key = (query, num_results)
+    entry = _search_cache.get(cache_key)
+    if entry is not None:
+        if time.monotonic() < entry[0]:
+            return entry[1]
+        del _search_cache[cache_key]
+
+    fut = _inflight.get(cache_key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = fut
+    try:
+        result = await _google_search_uncached(query, num_results)
+        fut.set_result(result)
+        if not result.startswith("❌"):  # Don't cache failures
+            if len(_search_cache) >= _CACHE_MAX:
+                del _search_cache[next(iter(_search_cache))]
+            _search_cache[cache_key] = (time.monotonic() + _CACHE_TTL, result)
+        return result
+    except asyncio.CancelledError:
+        # Only the leader was cancelled; waiters see the cancellation too
+        fut.cancel()
+        raise
+    except BaseException as e:
+        # Hand waiters the real failure; cancelling the future here would
+        # surface a bogus CancelledError in tasks that were never cancelled
+        fut.set_exception(e)
+        fut.exception()  # Mark retrieved in case no waiter is attached
+        raise
+    finally:
+        _inflight.pop(cache_key, None)
+
+
+async def _google_search_uncached(query: str, num_results: int) -> str:
+    """Perform the actual Custom Search API request."""
+
     # Get API credentials from environment
     api_key = os.getenv('GOOGLE_SEARCH_API_KEY')
     search_engine_id = os.getenv('GOOGLE_SEARCH_ENGINE_ID')
@@ -40,40 +115,51 @@ async def google_search(query: str, num_results: int = 5) -> str:
             'num': num_results
         }
         
-        # Make the search request
-        response = requests.get(url, params=params, timeout=30)
+        # Make the search request without blocking the event loop
+        response = await _get_client().get(url, params=params)
         response.raise_for_status()
-        
-        search_data = response.json()
-        
+
+        # orjson parses the raw bytes directly, no intermediate str decode
+        search_data = orjson.loads(response.content)
+
         # Check if we got results
         if 'items' not in search_data:
             return f"🔍 No search results found for: {query}"
-        
-        # Format the results
-        results = []
-        results.append(f"🔍 **Google Search Results for: {query}**\n")
-        
-        for i, item in enumerate(search_data['items'], 1):
-            title = item.get('title', 'No title')
-            link = item.get('link', '')
-            snippet = item.get('snippet', 'No description available')
-            
-            results.append(f"**{i}. {title}**")
-            results.append(f"   🔗 {link}")
-            results.append(f"   📝 {snippet}")
-            results.append("")  # Empty line for spacing
-        
+
+        # Format the results with one join instead of per-item appends
+        items_text = "\n".join(
+            f"**{i}. {item.get('title', 'No title')}**\n"
+            f"   🔗 {item.get('link', '')}\n"
+            f"   📝 {item.get('snippet', 'No description available')}\n"
+            for i, item in enumerate(search_data['items'], 1)
+        )
+        result = f"🔍 **Google Search Results for: {query}**\n\n{items_text}"
+
         # Add search statistics if available
         if 'searchInformation' in search_data:
             search_info = search_data['searchInformation']
             total_results = search_info.get('totalResults', 'Unknown')
             search_time = search_info.get('searchTime', 'Unknown')
-            results.append(f"📊 Found {total_results} results in {search_time} seconds")
-        
-        return "\n".join(results)
+            result += f"\n📊 Found {total_results} results in {search_time} seconds"
+
+        return result
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return f"❌ Search request failed: {str(e)}"
     except Exception as e:
         return f"❌ Search error: {str(e)}"
+
+
+async def google_search_many(queries: list, num_results: int = 5) -> list:
+    """Run several Google searches concurrently.
+
+    Args:
+        queries: List of search query strings
+        num_results: Number of results per query
+
+    Returns:
+        List of formatted result strings, in the same order as the queries
+    """
+    return await asyncio.gather(
+        *(google_search(query, num_results) for query in queries)
+    )
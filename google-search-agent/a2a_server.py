@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Google Search Agent A2A Server."""
 
+import os
+
 import uvicorn
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
@@ -57,13 +59,31 @@ def create_a2a_server():
     return server
 
 
+def create_app():
+    """Build the ASGI app (uvicorn factory target, one app per worker)."""
+    return create_a2a_server().build()
+
+
 def main():
     """Start the A2A server."""
     print("🔍 Starting Google Search Agent A2A Server...")
     print("📋 Agent card will be available at: http://localhost:8001/.well-known/agent.json")
-    
-    server = create_a2a_server()
-    uvicorn.run(server.build(), host='127.0.0.1', port=8001)
+
+    # uvicorn's loop/http 'auto' picks uvloop and httptools when installed
+    # (install the 'perf' extra). The executor is stateless per request, so
+    # extra workers scale up to Ollama's OLLAMA_NUM_PARALLEL.
+    workers = int(os.getenv('A2A_WORKERS', '1'))
+    if workers > 1:
+        # Multi-worker mode needs an import string so uvicorn can fork
+        uvicorn.run(
+            'a2a_server:create_app',
+            factory=True,
+            host='127.0.0.1',
+            port=8001,
+            workers=workers,
+        )
+    else:
+        uvicorn.run(create_app(), host='127.0.0.1', port=8001)
 
 
 if __name__ == '__main__':
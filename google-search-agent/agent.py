@@ -15,8 +15,11 @@
 """Google Search Agent - A2A Server implementation."""
 
 import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import List, Dict, Any, Optional
 
@@ -24,18 +27,36 @@ from google.adk import Agent
 from google.adk.tools import google_search
 from google.genai import Client, types
 
-from .config import config
+from .config import config, MAX_RESULTS
 
 
-# Configure logging
+# Configure logging. The root logger gets only a QueueHandler, so hot-path
+# log calls are an in-memory queue append; the listener thread owns the
+# stream and file handlers (and their formatter), keeping disk writes off
+# the event loop.
+_log_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler("google_search_agent.log"),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Plain passthrough on the queue side; the listener's handlers apply the
+# real format (basicConfig would otherwise install its default formatter
+# here and the prefix would be added twice)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
 logging.basicConfig(
     level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("google_search_agent.log"),
-    ],
+    handlers=[_queue_handler],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -50,9 +71,11 @@ async def perform_google_search(query: str, num_results: Optional[int] = None) -
         Formatted search results as a string
     """
     try:
-        num_results = num_results or config.max_search_results
+        num_results = num_results or MAX_RESULTS
         logger.info(
-            f"Performing Google search for query: '{query}' with {num_results} results"
+            "Performing Google search for query: '%s' with %d results",
+            query,
+            num_results,
         )
 
         # Use the ADK google_search tool
@@ -94,24 +117,13 @@ async def web_search_comprehensive(query: str, max_results: int = 10) -> str:
         Comprehensive search results with analysis
     """
     try:
-        logger.info(f"Performing comprehensive web search for: '{query}'")
+        logger.info("Performing comprehensive web search for: '%s'", query)
 
         # Perform the search
-        search_results = await perform_google_search(query, max_results)
-
-        # Add analysis context
-        analysis_prompt = f"""
-        Based on the search results above, provide a comprehensive analysis that includes:
-        1. A summary of the key findings
-        2. The most relevant and authoritative sources
-        3. Any trends or patterns in the information
-        4. Confidence level in the information quality
-        
-        Search Query: {query}
-        Results: {search_results}
-        """
-
-        return search_results
+        # TODO: If deeper analysis is wanted here, send the results through
+        # the Gemini client with an analysis prompt instead of returning
+        # them as-is.
+        return await perform_google_search(query, max_results)
 
     except Exception as e:
         error_msg = f"Error in comprehensive web search: {str(e)}"
@@ -124,16 +136,14 @@ try:
     client = Client()
     logger.info("Gemini client initialized successfully")
 except Exception as e:
-    logger.error(f"Failed to initialize Gemini client: {e}")
+    logger.error("Failed to initialize Gemini client: %s", e)
     client = None
 
 
-# Define the root agent
-root_agent = Agent(
-    model=config.model,
-    name=config.agent_name,
-    description=config.agent_description,
-    instruction=f"""
+# Agent instruction, built and interned once so every request payload and
+# upstream prompt cache sees the same string object
+INSTRUCTION = sys.intern(
+    f"""
     You are a specialized Google Search Agent that performs web searches and provides comprehensive, accurate information.
     
     Your capabilities include:
@@ -157,7 +167,16 @@ root_agent = Agent(
     4. Include source information where appropriate
     
     Maximum search results per query: {config.max_search_results}
-    """,
+    """
+)
+
+
+# Define the root agent
+root_agent = Agent(
+    model=config.model,
+    name=config.agent_name,
+    description=config.agent_description,
+    instruction=INSTRUCTION,
     tools=[google_search, perform_google_search, web_search_comprehensive],
     generate_content_config=types.GenerateContentConfig(
         safety_settings=[
@@ -182,9 +201,9 @@ root_agent = Agent(
 )
 
 
-def print_startup_banner():
-    """Print startup banner."""
-    banner = f"""
+# Startup banner, rendered once at import time; config is frozen, so the
+# interpolated values cannot change afterwards
+_STARTUP_BANNER = f"""
     ╔══════════════════════════════════════════════════════════════════════════════════════╗
     ║                             Google Search Agent (A2A Server)                         ║
     ║                                                                                      ║
@@ -198,7 +217,21 @@ def print_startup_banner():
     ║  Ready to handle search requests from base-ai-agent via A2A protocol                ║
     ╚══════════════════════════════════════════════════════════════════════════════════════╝
     """
-    print(banner)
+
+
+def print_startup_banner():
+    """Print startup banner."""
+    print(_STARTUP_BANNER)
+
+    # Warm the shared Gemini client now so the first user search does not
+    # pay TLS setup and auth on top of its own latency
+    if client is not None:
+        try:
+            asyncio.run(client.aio.models.list())
+            logger.info("Gemini client warmed up")
+        except Exception as e:
+            logger.warning("Gemini client warmup failed: %s", e)
+
     logger.info("Google Search Agent initialized and ready")
 
 
@@ -208,9 +241,9 @@ if __name__ == "__main__":
     # Validate configuration
     is_valid, error_msg = config.validate()
     if not is_valid:
-        logger.error(f"Configuration validation failed: {error_msg}")
+        logger.error("Configuration validation failed: %s", error_msg)
         sys.exit(1)
 
     logger.info("Google Search Agent is ready to serve A2A requests")
-    logger.info(f"Agent available at: {config.get_agent_url()}")
-    logger.info(f"Agent JSON available at: {config.get_agent_json_url()}")
+    logger.info("Agent available at: %s", config.get_agent_url())
+    logger.info("Agent JSON available at: %s", config.get_agent_json_url())
@@ -14,40 +14,68 @@
 
 """Configuration for Google Search Agent."""
 
+import functools
 import os
+from dataclasses import dataclass
 from typing import Optional
 
 
+@dataclass(frozen=True, slots=True)
 class GoogleSearchConfig:
-    """Configuration for Google Search Agent."""
+    """Configuration for Google Search Agent.
 
-    def __init__(self):
-        # Server configuration
-        self.host = os.getenv("GOOGLE_SEARCH_AGENT_HOST", "localhost")
-        self.port = int(os.getenv("GOOGLE_SEARCH_AGENT_PORT", "8001"))
-        self.debug = os.getenv("GOOGLE_SEARCH_AGENT_DEBUG", "false").lower() == "true"
+    Frozen with slots: fields are read once from the environment via
+    from_env(), attribute access is a direct slot load, and accidental
+    runtime mutation raises.
+    """
 
-        # Agent configuration
-        self.agent_name = "google_search_agent"
-        self.agent_description = "A specialized agent for performing Google search queries and providing comprehensive search results."
-        self.agent_version = "1.0.0"
+    # Server configuration
+    host: str
+    port: int
+    debug: bool
 
-        # Model configuration
-        self.model = os.getenv("GOOGLE_SEARCH_AGENT_MODEL", "gemini-2.0-flash-001")
+    # Model configuration
+    model: str
 
-        # Google Search API configuration
-        self.google_search_api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
-        self.google_search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+    # Google Search API configuration
+    google_search_api_key: Optional[str]
+    google_search_engine_id: Optional[str]
 
-        # Search configuration
-        self.max_search_results = int(os.getenv("MAX_SEARCH_RESULTS", "10"))
-        self.search_timeout = int(os.getenv("SEARCH_TIMEOUT", "30"))
+    # Search configuration
+    max_search_results: int
+    search_timeout: int
 
-        # Logging configuration
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
+    # Logging configuration
+    log_level: str
 
+    # Agent configuration
+    agent_name: str = "google_search_agent"
+    agent_description: str = "A specialized agent for performing Google search queries and providing comprehensive search results."
+    agent_version: str = "1.0.0"
+
+    @classmethod
+    def from_env(cls) -> "GoogleSearchConfig":
+        """Build the configuration from environment variables, once."""
+        return cls(
+            host=os.getenv("GOOGLE_SEARCH_AGENT_HOST", "localhost"),
+            port=int(os.getenv("GOOGLE_SEARCH_AGENT_PORT", "8001")),
+            debug=os.getenv("GOOGLE_SEARCH_AGENT_DEBUG", "false").lower() == "true",
+            model=os.getenv("GOOGLE_SEARCH_AGENT_MODEL", "gemini-2.0-flash-001"),
+            google_search_api_key=os.getenv("GOOGLE_SEARCH_API_KEY"),
+            google_search_engine_id=os.getenv("GOOGLE_SEARCH_ENGINE_ID"),
+            max_search_results=int(os.getenv("MAX_SEARCH_RESULTS", "10")),
+            search_timeout=int(os.getenv("SEARCH_TIMEOUT", "30")),
+            log_level=os.getenv("LOG_LEVEL", "INFO"),
+        )
+
+    @functools.cache
     def validate(self) -> tuple[bool, Optional[str]]:
-        """Validate configuration."""
+        """Validate configuration.
+
+        Cached per instance (the dataclass is frozen, hence hashable), so
+        run.py and agent.py validating the same config pay the checks
+        once.
+        """
         if not self.google_search_api_key:
             return False, "GOOGLE_SEARCH_API_KEY is required"
         if not self.google_search_engine_id:
@@ -64,4 +92,7 @@ class GoogleSearchConfig:
 
 
 # Global configuration instance
-config = GoogleSearchConfig()
+config = GoogleSearchConfig.from_env()
+
+# Hot field bound to a module constant for search-path lookups
+MAX_RESULTS = config.max_search_results
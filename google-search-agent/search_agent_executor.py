@@ -1,22 +1,97 @@
 """Google Search Agent Executor for A2A communication."""
 
 import asyncio
+import atexit
+import hashlib
 import logging
+import math
 import os
+import re
+import time
 from typing import Any
 
+import httpx
+import litellm
+import orjson
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.utils import new_agent_text_message
-from googleapiclient.discovery import build
-from google.adk.models.lite_llm import LiteLlm
+
+# Optional incremental JSON parser: result items are yielded as their bytes
+# arrive instead of buffering the whole Custom Search response first
+try:
+    import ijson
+
+    _IJSON_AVAILABLE = True
+except ImportError:
+    _IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Concurrent LLM completions allowed in flight. Sized to match the Ollama
+# backend's parallelism (see OLLAMA_NUM_PARALLEL) so bursts of A2A requests
+# queue here instead of thrashing the model server.
+_LLM_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '4'))
+_llm_gate = asyncio.Semaphore(_LLM_CONCURRENCY)
+
+# Formatted summaries keyed by a digest of (query, result links). Re-asked
+# queries whose results have not changed skip the LLM round-trip entirely.
+# Plain dict in insertion order doubles as the LRU; values are
+# (expiry, formatted_text).
+_FORMAT_CACHE_MAX = 512
+_FORMAT_CACHE_TTL = 600.0  # seconds
+_format_cache: dict = {}
+
+# Bounds for the per-executor Custom Search response cache
+_SEARCH_CACHE_MAX = 2048
+_SEARCH_CACHE_TTL = 600.0  # seconds
+
+# Leading "search for:"/"find"/"look up" style prefixes stripped from
+# incoming requests, compiled once instead of looped per message. The
+# leads tuple gates a bounded startswith check so messages without a
+# prefix (the common case) skip the regex entirely.
+_PREFIX_RE = re.compile(r"^\s*(?:search\s+for|find|look\s+up)\s*:?\s*", re.IGNORECASE)
+_PREFIX_LEADS = ("search", "find", "look")
+
+
+def _format_cache_key(query: str, results: list[dict[str, Any]]) -> str:
+    payload = query + "|" + "|".join(r["link"] for r in results)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _format_cache_get(key: str) -> str | None:
+    entry = _format_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        del _format_cache[key]
+        return None
+    return entry[1]
+
+
+class _AiterByteReader:
+    """Minimal async file adapter over an httpx byte stream for ijson."""
+
+    def __init__(self, aiter):
+        self._aiter = aiter
+
+    async def read(self, n: int = -1) -> bytes:
+        # ijson tolerates chunks of any size; empty bytes signal EOF
+        try:
+            return await anext(self._aiter)
+        except StopAsyncIteration:
+            return b""
+
+
+def _format_cache_put(key: str, text: str) -> None:
+    if len(_format_cache) >= _FORMAT_CACHE_MAX:
+        del _format_cache[next(iter(_format_cache))]
+    _format_cache[key] = (time.monotonic() + _FORMAT_CACHE_TTL, text)
+
 
 class GoogleSearchAgentExecutor(AgentExecutor):
     """Agent executor for Google Search functionality."""
-    
+
     def __init__(self):
         """Initialize the Google Search Agent Executor."""
         self.search_api_key = os.getenv('GOOGLE_SEARCH_API_KEY')
@@ -24,21 +99,26 @@ class GoogleSearchAgentExecutor(AgentExecutor):
         
         if not self.search_api_key or not self.search_engine_id:
             logger.warning("Google Search API credentials not found. Agent will return error messages.")
-        
-        # Initialize Gemini model for processing search results
-        self.model = LiteLlm(
-            model="gemini-1.5-flash",
-            temperature=0.3,
-            max_tokens=1024,
-        )
-        
-        # Fallback to Ollama if Gemini fails
-        self.fallback_model = LiteLlm(
-            model="ollama_chat/llama3.1:8b",
-            api_base="http://localhost:11434",
-            temperature=0.3,
-            max_tokens=1024,
-        )
+
+        # Shared async client for direct Custom Search REST calls, so
+        # concurrent searches overlap on the event loop and reuse pooled
+        # connections
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        try:
+            self._http = httpx.AsyncClient(timeout=10.0, limits=limits, http2=True)
+        except ImportError:
+            # h2 not installed - HTTP/1.1 keep-alive still reuses sockets
+            self._http = httpx.AsyncClient(timeout=10.0, limits=limits)
+        atexit.register(self._close_http_at_exit)
+
+        # Custom Search responses keyed by (query, num): repeat searches
+        # serve locally instead of paying latency and API quota again.
+        # Values are (expiry, results); insertion order doubles as the LRU.
+        self._search_cache: dict = {}
+
+        # In-flight searches keyed like the cache, so concurrent identical
+        # queries coalesce into one upstream API call
+        self._inflight: dict = {}
     
     async def execute(
         self,
@@ -58,19 +138,28 @@ class GoogleSearchAgentExecutor(AgentExecutor):
             
             # Perform the search
             search_results = await self._perform_google_search(query)
-            
-            # Process and format the results
-            formatted_response = await self._format_search_results(query, search_results)
-            
-            # Send the response
-            await event_queue.enqueue_event(new_agent_text_message(formatted_response))
+
+            # Stream tokens only to callers that opened a streaming
+            # request; everyone else gets one complete message
+            await self._stream_search_results(
+                query,
+                search_results,
+                event_queue,
+                streaming=self._is_streaming_request(context),
+            )
             
         except Exception as e:
-            logger.error(f"Error in search execution: {e}")
+            logger.error("Error in search execution: %s", e)
             await event_queue.enqueue_event(
                 new_agent_text_message(f"❌ Search failed: {str(e)}")
             )
     
+    def _close_http_at_exit(self) -> None:
+        try:
+            asyncio.run(self._http.aclose())
+        except Exception:
+            pass  # Interpreter is shutting down; nothing useful to do
+
     async def cancel(
         self, context: RequestContext, event_queue: EventQueue
     ) -> None:
@@ -81,43 +170,123 @@ class GoogleSearchAgentExecutor(AgentExecutor):
     
     def _extract_search_query(self, context: RequestContext) -> str:
         """Extract the search query from the request context."""
-        # Get the last message from the user
-        if hasattr(context, 'messages') and context.messages:
-            last_message = context.messages[-1]
-            if hasattr(last_message, 'parts'):
-                for part in last_message.parts:
-                    if hasattr(part, 'text'):
-                        text = part.text.strip()
-                        # Remove common prefixes
-                        prefixes = ["search for:", "search for", "find:", "find", "look up:", "look up"]
-                        for prefix in prefixes:
-                            if text.lower().startswith(prefix.lower()):
-                                return text[len(prefix):].strip()
-                        return text
-        
+        # Get the last message from the user. getattr with a default is
+        # one lookup per attribute; hasattr would pay a second lookup
+        # (wrapped in try/except) on every hit.
+        messages = getattr(context, 'messages', None)
+        if messages:
+            for part in getattr(messages[-1], 'parts', ()):
+                text = getattr(part, 'text', None)
+                if text is not None:
+                    # Lowercase only a bounded lead, not the whole
+                    # message, to decide whether stripping is needed
+                    if text[:20].lstrip().lower().startswith(_PREFIX_LEADS):
+                        return _PREFIX_RE.sub('', text, count=1).strip()
+                    return text.strip()
+
         # Fallback: check for task description
-        if hasattr(context, 'task') and context.task:
-            if hasattr(context.task, 'description'):
-                return context.task.description.strip()
-        
+        task = getattr(context, 'task', None)
+        if task is not None:
+            description = getattr(task, 'description', None)
+            if description is not None:
+                return description.strip()
+
         return ""
     
-    async def _perform_google_search(self, query: str) -> list[dict[str, Any]]:
+    async def _perform_google_search(
+        self, query: str, num_results: int = 5
+    ) -> list[dict[str, Any]]:
         """Perform the actual Google search."""
         if not self.search_api_key or not self.search_engine_id:
             return []
-        
+
+        cache_key = (query, num_results)
+        entry = self._search_cache.get(cache_key)
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                return entry[1]
+            del self._search_cache[cache_key]
+
+        # Coalesce concurrent identical queries into one API call
+        fut = self._inflight.get(cache_key)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = fut
         try:
-            # Build the search service
-            service = build("customsearch", "v1", developerKey=self.search_api_key)
-            
-            # Execute the search
-            result = service.cse().list(
-                q=query,
-                cx=self.search_engine_id,
-                num=5  # Get top 5 results
-            ).execute()
-            
+            search_results = await self._fetch_all_pages(query, num_results)
+            fut.set_result(search_results)
+
+            if search_results:  # Don't cache empty/failed lookups
+                if len(self._search_cache) >= _SEARCH_CACHE_MAX:
+                    del self._search_cache[next(iter(self._search_cache))]
+                self._search_cache[cache_key] = (
+                    time.monotonic() + _SEARCH_CACHE_TTL,
+                    search_results,
+                )
+
+            return search_results
+        except asyncio.CancelledError:
+            # Only the leader was cancelled; waiters see the cancellation too
+            fut.cancel()
+            raise
+        except BaseException as e:
+            # Hand waiters the real failure; cancelling the future here
+            # would surface a bogus CancelledError in tasks that were
+            # never cancelled
+            fut.set_exception(e)
+            fut.exception()  # Mark retrieved in case no waiter is attached
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def _fetch_all_pages(
+        self, query: str, num_results: int
+    ) -> list[dict[str, Any]]:
+        """Fetch the result pages for a query concurrently.
+
+        The API caps a page at 10 items; requests beyond that are issued
+        as parallel paged GETs, so an N-page search costs roughly one
+        page's latency.
+        """
+        pages = math.ceil(num_results / 10)
+        if pages <= 1:
+            return await self._fetch_search_results(query, num_results, start=1)
+
+        results_lists = await asyncio.gather(
+            *(
+                self._fetch_search_results(
+                    query, min(10, num_results - page * 10), start=page * 10 + 1
+                )
+                for page in range(pages)
+            )
+        )
+        return [result for page_results in results_lists for result in page_results]
+
+    async def _fetch_search_results(
+        self, query: str, num: int, start: int
+    ) -> list[dict[str, Any]]:
+        """Fetch one page of Custom Search results from the API."""
+        params = {
+            'key': self.search_api_key,
+            'cx': self.search_engine_id,
+            'q': query,
+            'num': num,
+            'start': start,
+        }
+        try:
+            if _IJSON_AVAILABLE:
+                return await self._fetch_page_streaming(params, num)
+
+            # Native async GET; the googleapiclient execute() call blocked
+            # the event loop and serialized concurrent searches
+            response = await self._http.get(
+                "https://www.googleapis.com/customsearch/v1", params=params
+            )
+            response.raise_for_status()
+            result = response.json()
+
             # Extract relevant information
             search_results = []
             if 'items' in result:
@@ -128,28 +297,50 @@ class GoogleSearchAgentExecutor(AgentExecutor):
                         'snippet': item.get('snippet', ''),
                         'displayLink': item.get('displayLink', '')
                     })
-            
+
             return search_results
-            
+
         except Exception as e:
-            logger.error(f"Google search failed: {e}")
+            logger.error("Google search failed: %s", e)
             return []
+
+    async def _fetch_page_streaming(
+        self, params: dict[str, Any], num: int
+    ) -> list[dict[str, Any]]:
+        """Parse one page of results incrementally as response bytes arrive.
+
+        Avoids buffering the full JSON body before extraction, which keeps
+        peak memory flat when several paged requests are in flight at once.
+        """
+        search_results: list[dict[str, Any]] = []
+        async with self._http.stream(
+            "GET", "https://www.googleapis.com/customsearch/v1", params=params
+        ) as response:
+            response.raise_for_status()
+            reader = _AiterByteReader(response.aiter_bytes())
+            async for item in ijson.items(reader, 'items.item'):
+                search_results.append({
+                    'title': item.get('title', ''),
+                    'link': item.get('link', ''),
+                    'snippet': item.get('snippet', ''),
+                    'displayLink': item.get('displayLink', '')
+                })
+                if len(search_results) >= num:
+                    break
+
+        return search_results
     
-    async def _format_search_results(self, query: str, results: list[dict[str, Any]]) -> str:
-        """Format the search results using Gemini."""
-        if not results:
-            return f"🔍 No search results found for '{query}'. This might be due to API configuration issues or the query being too specific."
-        
-        # Format results for processing
-        results_text = f"Search query: {query}\\n\\nSearch results:\\n"
-        for i, result in enumerate(results, 1):
-            results_text += f"\\n{i}. **{result['title']}**\\n"
-            results_text += f"   URL: {result['link']}\\n"
-            results_text += f"   {result['snippet']}\\n"
-        
-        try:
-            # Use AI to summarize and format the results
-            prompt = f"""You are a helpful search assistant. Summarize these search results in a clear, informative way:
+    def _build_results_prompt(self, query: str, results: list[dict[str, Any]]) -> str:
+        """Build the summarization prompt for a set of search results.
+
+        Results are embedded as JSON (orjson serializes in one C pass) so
+        the model gets a clean schema instead of hand-built markup.
+        """
+        results_text = orjson.dumps(
+            {"query": query, "results": results}, option=orjson.OPT_INDENT_2
+        ).decode()
+
+        return f"""You are a helpful search assistant. Summarize these search results, provided as JSON, in a clear, informative way:
 
 {results_text}
 
@@ -162,12 +353,105 @@ Format your response to be helpful and easy to read.
 
 IMPORTANT: At the end, include a section called "SCRAPABLE_URLS:" followed by the URLs that would be good for web scraping to get more detailed information. List each URL on a new line."""
 
-            # Try Gemini first
-            response = await asyncio.to_thread(
-                self.model.completion,
-                messages=[{"role": "user", "content": prompt}]
+    @staticmethod
+    def _is_streaming_request(context: RequestContext) -> bool:
+        """Best-effort check for a message/stream request.
+
+        The SDK has not exposed this flag under one name across
+        versions, so probe the known spellings and default to the
+        single-message shape that message/send callers rely on.
+        """
+        for attr in ('is_streaming', 'streaming'):
+            value = getattr(context, attr, None)
+            if isinstance(value, bool):
+                return value
+        return False
+
+    async def _stream_search_results(
+        self,
+        query: str,
+        results: list[dict[str, Any]],
+        event_queue: EventQueue,
+        streaming: bool = False,
+    ) -> None:
+        """Send the formatted results, incrementally for streaming callers.
+
+        With `streaming` set, deltas go out as they decode and
+        time-to-first-byte drops from a full completion to the first
+        token. Non-streaming callers — like the base agent, which
+        extracts text from a single send_message response — always
+        receive the complete text as one message. If the streaming LLM
+        path fails, fall back to the non-streaming formatter.
+        """
+        if not results:
+            await event_queue.enqueue_event(
+                new_agent_text_message(
+                    f"🔍 No search results found for '{query}'. This might be due to API configuration issues or the query being too specific."
+                )
             )
-            
+            return
+
+        cache_key = _format_cache_key(query, results)
+        cached = _format_cache_get(cache_key)
+        if cached is not None:
+            await event_queue.enqueue_event(new_agent_text_message(cached))
+            return
+
+        prompt = self._build_results_prompt(query, results)
+
+        try:
+            async with _llm_gate:
+                response = await litellm.acompletion(
+                    model="gemini-1.5-flash",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=1024,
+                    stream=True,
+                )
+
+                header = f"🔍 **Search Results for '{query}':**\n\n"
+                if streaming:
+                    await event_queue.enqueue_event(new_agent_text_message(header))
+                deltas = []
+                async for chunk in response:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        deltas.append(delta)
+                        if streaming:
+                            await event_queue.enqueue_event(
+                                new_agent_text_message(delta)
+                            )
+            full_text = header + "".join(deltas)
+            _format_cache_put(cache_key, full_text)
+            if not streaming:
+                await event_queue.enqueue_event(new_agent_text_message(full_text))
+            return
+
+        except Exception as e:
+            logger.error("Streaming formatting failed, falling back: %s", e)
+
+        formatted_response = await self._format_search_results(query, results)
+        _format_cache_put(cache_key, formatted_response)
+        await event_queue.enqueue_event(new_agent_text_message(formatted_response))
+
+    async def _format_search_results(self, query: str, results: list[dict[str, Any]]) -> str:
+        """Format the search results using Gemini."""
+        if not results:
+            return f"🔍 No search results found for '{query}'. This might be due to API configuration issues or the query being too specific."
+
+        prompt = self._build_results_prompt(query, results)
+
+        try:
+            # Try Gemini first; native async call instead of parking a
+            # threadpool worker for the whole generation
+            async with _llm_gate:
+                response = await litellm.acompletion(
+                    model="gemini-1.5-flash",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=1024,
+                )
+
             # Extract the response text
             if hasattr(response, 'choices') and response.choices:
                 formatted_result = response.choices[0].message.content
@@ -177,36 +461,41 @@ IMPORTANT: At the end, include a section called "SCRAPABLE_URLS:" followed by th
                 raise Exception("Gemini response format unexpected")
                 
         except Exception as e:
-            logger.error(f"Error formatting results with Gemini: {e}")
+            logger.error("Error formatting results with Gemini: %s", e)
             # Try with fallback Ollama model
             try:
                 logger.info("Trying fallback Ollama model for formatting")
-                response = await asyncio.to_thread(
-                    self.fallback_model.completion,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                
+                async with _llm_gate:
+                    response = await litellm.acompletion(
+                        model="ollama_chat/llama3.1:8b",
+                        api_base="http://localhost:11434",
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.3,
+                        max_tokens=1024,
+                    )
+
                 if hasattr(response, 'choices') and response.choices:
                     formatted_result = response.choices[0].message.content
                     return f"🔍 **Search Results for '{query}':**\\n\\n{formatted_result}"
                 else:
                     return self._simple_format_results(query, results)
             except Exception as fallback_error:
-                logger.error(f"Fallback model also failed: {fallback_error}")
+                logger.error("Fallback model also failed: %s", fallback_error)
                 return self._simple_format_results(query, results)
     
     def _simple_format_results(self, query: str, results: list[dict[str, Any]]) -> str:
         """Simple fallback formatting for search results."""
-        formatted = f"🔍 **Search Results for '{query}':**\\n\\n"
-        
-        for i, result in enumerate(results, 1):
-            formatted += f"**{i}. {result['title']}**\\n"
-            formatted += f"🔗 {result['link']}\\n"
-            formatted += f"📄 {result['snippet']}\\n\\n"
-        
+        parts = [f"🔍 **Search Results for '{query}':**\\n\\n"]
+
+        parts.extend(
+            f"**{i}. {result['title']}**\\n"
+            f"🔗 {result['link']}\\n"
+            f"📄 {result['snippet']}\\n\\n"
+            for i, result in enumerate(results, 1)
+        )
+
         # Add scrapable URLs section
-        formatted += "\\n**SCRAPABLE_URLS:**\\n"
-        for result in results[:3]:  # Limit to top 3 URLs
-            formatted += f"{result['link']}\\n"
-        
-        return formatted
+        parts.append("\\n**SCRAPABLE_URLS:**\\n")
+        parts.extend(f"{result['link']}\\n" for result in results[:3])  # Top 3 URLs
+
+        return "".join(parts)
@@ -19,43 +19,54 @@
 """
 Example future implementation:
 
+import functools
 import os
 import logging
+import stat as stat_module
 from typing import List, Dict, Any
 from pathlib import Path
 
 class MCPFilesystemServer:
     def __init__(self, allowed_paths: List[str]):
-        self.allowed_paths = [Path(p).resolve() for p in allowed_paths]
-        self.logger = logging.getLogger(__name__)
-    
-    def is_path_allowed(self, path: Path) -> bool:
-        resolved_path = path.resolve()
-        return any(
-            resolved_path.is_relative_to(allowed_path)
-            for allowed_path in self.allowed_paths
+        # Allowed roots resolved once; checks below are plain string
+        # prefix comparisons instead of per-call Path.resolve syscalls
+        self._allowed_str = tuple(
+            os.path.realpath(p) + os.sep for p in allowed_paths
         )
-    
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _realpath(path: str) -> str:
+        # realpath walks symlinks (several syscalls); hot read loops hit
+        # the same paths repeatedly, so cache recent lookups
+        return os.path.realpath(path)
+
+    def is_path_allowed(self, path: str) -> bool:
+        resolved = self._realpath(path) + os.sep
+        return any(resolved.startswith(allowed) for allowed in self._allowed_str)
+
     def read_file(self, path: str) -> str:
-        file_path = Path(path)
-        if not self.is_path_allowed(file_path):
+        if not self.is_path_allowed(path):
             raise PermissionError(f"Access denied to {path}")
-        
-        return file_path.read_text()
-    
+
+        return Path(path).read_text()
+
     def list_directory(self, path: str) -> List[Dict[str, Any]]:
-        dir_path = Path(path)
-        if not self.is_path_allowed(dir_path):
+        if not self.is_path_allowed(path):
             raise PermissionError(f"Access denied to {path}")
-        
+
         items = []
-        for item in dir_path.iterdir():
+        for item in Path(path).iterdir():
+            # One stat per entry instead of three (is_dir/is_file/stat)
+            st = item.stat()
+            is_dir = stat_module.S_ISDIR(st.st_mode)
             items.append({
                 "name": item.name,
-                "type": "directory" if item.is_dir() else "file",
-                "size": item.stat().st_size if item.is_file() else None,
-                "modified": item.stat().st_mtime
+                "type": "directory" if is_dir else "file",
+                "size": None if is_dir else st.st_size,
+                "modified": st.st_mtime
             })
-        
+
         return items
 """
@@ -14,12 +14,36 @@
 
 """MCP (Model Context Protocol) integration utilities."""
 
+import functools
 import logging
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Optional MCP imports, resolved once at module load instead of going
+# through the import machinery on every get_toolsets call
+try:
+    from google.adk.tools.mcp_tool import MCPToolset, StdioConnectionParams
+    from mcp import StdioServerParameters
+
+    _MCP_AVAILABLE = True
+except ImportError:
+    _MCP_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=None)
+def _build_toolset(command: str, args: Tuple[str, ...], tools: Optional[Tuple[str, ...]]):
+    """Build one MCPToolset; memoized so identical server configs reuse it."""
+    connection_params = StdioConnectionParams(
+        server_params=StdioServerParameters(command=command, args=list(args)),
+        timeout=5,
+    )
+    return MCPToolset(
+        connection_params=connection_params,
+        tool_filter=list(tools) if tools is not None else None,
+    )
+
 
 class MCPConfiguration:
     """Configuration manager for MCP servers and tools."""
@@ -56,7 +80,7 @@ class MCPConfiguration:
         }
 
         self.enabled_servers.append(server_config)
-        logger.info(f"Added filesystem MCP server for path: {allowed_path}")
+        logger.info("Added filesystem MCP server for path: %s", allowed_path)
 
     def add_custom_server(
         self,
@@ -81,7 +105,7 @@ class MCPConfiguration:
         }
 
         self.enabled_servers.append(server_config)
-        logger.info(f"Added custom MCP server: {server_type}")
+        logger.info("Added custom MCP server: %s", server_type)
 
     def get_toolsets(self):
         """Get configured MCP toolsets for agent integration.
@@ -89,30 +113,21 @@ class MCPConfiguration:
         Returns:
             List of MCPToolset objects ready for agent integration
         """
-        toolsets = []
-
-        try:
-            from google.adk.tools.mcp_tool import MCPToolset, StdioConnectionParams
-            from mcp import StdioServerParameters
-
-            for server in self.enabled_servers:
-                connection_params = StdioConnectionParams(
-                    server_params=StdioServerParameters(
-                        command=server["command"], args=server["args"]
-                    ),
-                    timeout=5,
-                )
-
-                toolset = MCPToolset(
-                    connection_params=connection_params, tool_filter=server.get("tools")
-                )
-
-                toolsets.append(toolset)
-                logger.info(f"Created MCP toolset for {server['type']}")
-
-        except ImportError as e:
-            logger.warning(f"MCP tools not available: {e}")
+        if not _MCP_AVAILABLE:
+            logger.warning("MCP tools not available")
             logger.info("Install MCP support with: uv add mcp 'google-adk[mcp]'")
+            return []
+
+        toolsets = []
+        for server in self.enabled_servers:
+            tools = server.get("tools")
+            toolset = _build_toolset(
+                server["command"],
+                tuple(server["args"]),
+                tuple(tools) if tools is not None else None,
+            )
+            toolsets.append(toolset)
+            logger.info("Created MCP toolset for %s", server['type'])
 
         return toolsets
 
@@ -147,15 +162,12 @@ def validate_mcp_dependencies() -> bool:
     Returns:
         True if MCP dependencies are available, False otherwise
     """
-    try:
-        import mcp
-        from google.adk.tools.mcp_tool import MCPToolset
-
+    if _MCP_AVAILABLE:
         return True
-    except ImportError:
-        logger.warning("MCP dependencies not found")
-        logger.info("Install with: uv add mcp 'google-adk[mcp]'")
-        return False
+
+    logger.warning("MCP dependencies not found")
+    logger.info("Install with: uv add mcp 'google-adk[mcp]'")
+    return False
 
 
 # Future: Add more MCP server types
@@ -1,17 +1,41 @@
 """Memory management utilities for AI agents."""
 
+import functools
+import heapq
 import os
 import json
+import re
+import sqlite3
 import time
 import hashlib
+
+import orjson
+import itertools
+from collections import defaultdict, deque
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from .semantic_index import create_semantic_index
+from .utils import format_timestamp
+
+# Optional fast hash for the 8-char context tag. xxh3 runs at multi-GB/s
+# versus MD5's ~0.33 GB/s, and the int digest skips the intermediate hex
+# string; bound at module scope so the hot add path pays no attribute
+# lookup. MD5 remains the fallback when xxhash is not installed.
+try:
+    from xxhash import xxh3_64_intdigest as _xxh3
+except ImportError:
+    _xxh3 = None
 
-@dataclass
+
+@dataclass(slots=True)
 class MemoryEntry:
-    """A single memory entry containing conversation context."""
+    """A single memory entry containing conversation context.
+
+    slots=True drops the per-instance __dict__, shrinking each entry by
+    roughly 200 bytes and speeding attribute access in the scan paths.
+    """
 
     timestamp: float
     user_message: str
@@ -19,10 +43,44 @@ class MemoryEntry:
     session_id: str
     context_hash: str
     metadata: Dict[str, Any] = None
+    # Display timestamp, computed once here so render loops do not call
+    # strftime per entry
+    formatted_ts: str = ""
+    # Lowercased text and word set, computed once at construction so
+    # every search_memory call scans without per-entry .lower()/.split()
+    # allocations. Derived state: excluded from exports.
+    _lower_user: str = field(init=False, repr=False, compare=False, default="")
+    _lower_resp: str = field(init=False, repr=False, compare=False, default="")
+    _words: frozenset = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the persisted fields, without asdict's deepcopy.
+
+        asdict recursively copies every field value; the export path only
+        needs references for immediate serialization.
+        """
+        return {
+            "timestamp": self.timestamp,
+            "user_message": self.user_message,
+            "assistant_response": self.assistant_response,
+            "session_id": self.session_id,
+            "context_hash": self.context_hash,
+            "metadata": self.metadata,
+            "formatted_ts": self.formatted_ts,
+        }
 
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
+        if not self.formatted_ts:
+            self.formatted_ts = format_timestamp(self.timestamp)
+        self._lower_user = self.user_message.lower()
+        self._lower_resp = self.assistant_response.lower()
+        self._words = frozenset(self._lower_user.split()) | frozenset(
+            self._lower_resp.split()
+        )
 
 
 class MemoryManager:
@@ -40,47 +98,233 @@ class MemoryManager:
             os.getenv("ENABLE_CROSS_SESSION_MEMORY", "true").lower() == "true"
         )
 
-        # Memory storage
+        # Memory storage. Entries arrive in timestamp order, so a bounded
+        # deque gives O(1) eviction of the oldest entry with no per-insert
+        # sort.
         self.current_session_memory: List[MemoryEntry] = []
-        self.persistent_memory: List[MemoryEntry] = []
+        self.persistent_memory: deque = deque(maxlen=self.max_history)
+
+        # Optional embedding index (None when semantic deps are missing);
+        # _indexed_entries maps index rows back to entries in add order.
+        # Removed rows are tombstoned (None) like the keyword index, and
+        # the index is rebuilt once tombstones dominate, so evicted or
+        # cleared entries neither resurface in search nor pile up forever.
+        self._semantic_index = create_semantic_index()
+        self._indexed_entries: List[Optional[MemoryEntry]] = []
+        self._semantic_rows: Dict[int, int] = {}
+        self._semantic_dead = 0
+
+        # Inverted token index for the keyword fallback: postings map a
+        # token to rows in _keyword_entries, so a query touches only
+        # entries sharing at least one word instead of the whole store.
+        # Removed rows are tombstoned (None) to keep postings stable.
+        self._keyword_entries: List[Optional[MemoryEntry]] = []
+        self._keyword_rows: Dict[int, int] = {}
+        self._token_index: Dict[str, set] = defaultdict(set)
 
         # Load existing memory
+        self._db = self._open_db()
         self._load_persistent_memory()
 
-    def _generate_context_hash(self, text: str) -> str:
-        """Generate a hash for context similarity comparison."""
+        # Index memories loaded from disk (batch-encoded on first search).
+        # _seen_hashes backs dedup-on-insert: the context hash already
+        # summarizes the (user, assistant) pair, so membership is enough.
+        self._seen_hashes: set = set()
+        for entry in self.persistent_memory:
+            self._seen_hashes.add(entry.context_hash)
+            self._index_keywords(entry)
+            if self._semantic_index is not None:
+                self._index_entry(entry)
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Add an entry to the semantic index."""
+        self._semantic_rows[id(entry)] = len(self._indexed_entries)
+        self._indexed_entries.append(entry)
+        self._semantic_index.add(
+            entry.user_message + " " + entry.assistant_response
+        )
+
+    def _unindex_entry(self, entry: MemoryEntry) -> None:
+        """Tombstone an entry's semantic row; compact when mostly dead."""
+        row = self._semantic_rows.pop(id(entry), None)
+        if row is None:
+            return
+        self._indexed_entries[row] = None
+        self._semantic_dead += 1
+        if (
+            self._semantic_dead > 64
+            and self._semantic_dead * 2 >= len(self._indexed_entries)
+        ):
+            self._compact_semantic_index()
+
+    def _compact_semantic_index(self) -> None:
+        """Rebuild the semantic index over live entries only.
+
+        FAISS rows cannot be deleted in place, so tombstones accumulate
+        until this drops them in one pass; re-encoding happens in the
+        next batched flush rather than here.
+        """
+        live = [entry for entry in self._indexed_entries if entry is not None]
+        self._semantic_index.reset()
+        self._indexed_entries = []
+        self._semantic_rows = {}
+        self._semantic_dead = 0
+        for entry in live:
+            self._index_entry(entry)
+
+    def _index_keywords(self, entry: MemoryEntry) -> None:
+        """Add an entry's tokens to the inverted index."""
+        row = len(self._keyword_entries)
+        self._keyword_entries.append(entry)
+        self._keyword_rows[id(entry)] = row
+        for token in entry._words:
+            self._token_index[token].add(row)
+
+    def _unindex_keywords(self, entry: MemoryEntry) -> None:
+        """Tombstone an entry's row and drop its postings."""
+        row = self._keyword_rows.pop(id(entry), None)
+        if row is None:
+            return
+        self._keyword_entries[row] = None
+        for token in entry._words:
+            postings = self._token_index.get(token)
+            if postings is not None:
+                postings.discard(row)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _generate_context_hash(text: str) -> str:
+        """Generate a hash for context similarity comparison.
+
+        Memoized: identical user+assistant pairs recur (retries, repeated
+        greetings), and the cache hit skips the encode+hash entirely.
+        """
+        if _xxh3 is not None:
+            return format(_xxh3(text.lower().encode()) & 0xFFFFFFFF, "08x")
         return hashlib.md5(text.lower().encode()).hexdigest()[:8]
 
-    def _load_persistent_memory(self) -> None:
-        """Load persistent memory from disk."""
-        memory_file = self.memory_dir / "persistent_memory.json"
-        if memory_file.exists():
-            try:
-                with open(memory_file, "r") as f:
-                    data = json.load(f)
-                    self.persistent_memory = [MemoryEntry(**entry) for entry in data]
-                    # Clean old entries
-                    self._cleanup_old_memories()
-            except Exception as e:
-                print(f"Warning: Could not load persistent memory: {e}")
-                self.persistent_memory = []
-
-    def _save_persistent_memory(self) -> None:
-        """Save persistent memory to disk."""
+    def _open_db(self) -> sqlite3.Connection:
+        """Open the memory database, creating the schema if needed.
+
+        WAL journaling lets a reader and the writer proceed concurrently,
+        and synchronous=NORMAL drops the per-commit fsync while still
+        surviving process crashes.
+        """
+        db = sqlite3.connect(self.memory_dir / "memory.db", check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            """CREATE TABLE IF NOT EXISTS memories (
+                id INTEGER PRIMARY KEY,
+                timestamp REAL NOT NULL,
+                user_message TEXT NOT NULL,
+                assistant_response TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                context_hash TEXT NOT NULL,
+                metadata TEXT NOT NULL DEFAULT '{}'
+            )"""
+        )
+        db.commit()
+        return db
+
+    _INSERT_SQL = (
+        "INSERT INTO memories (timestamp, user_message, assistant_response,"
+        " session_id, context_hash, metadata) VALUES (?, ?, ?, ?, ?, ?)"
+    )
+
+    @staticmethod
+    def _entry_row(entry: MemoryEntry) -> Tuple:
+        return (
+            entry.timestamp,
+            entry.user_message,
+            entry.assistant_response,
+            entry.session_id,
+            entry.context_hash,
+            json.dumps(entry.metadata or {}),
+        )
+
+    def _migrate_legacy_json(self) -> None:
+        """Import entries from the old persistent_memory.json file, once."""
         memory_file = self.memory_dir / "persistent_memory.json"
+        if not memory_file.exists():
+            return
+        # orjson parses the whole buffer in one C pass; entries still go
+        # through MemoryEntry so __post_init__ builds the derived fields
+        # (a __new__ shortcut would skip them and slots have no __dict__)
+        data = orjson.loads(memory_file.read_bytes())
+        self._db.executemany(
+            self._INSERT_SQL,
+            [self._entry_row(MemoryEntry(**entry)) for entry in data],
+        )
+        self._db.commit()
+        memory_file.rename(memory_file.with_suffix(".json.migrated"))
+
+    def _load_persistent_memory(self) -> None:
+        """Load persistent memory from the database."""
         try:
-            data = [asdict(entry) for entry in self.persistent_memory]
-            with open(memory_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._migrate_legacy_json()
+            rows = self._db.execute(
+                "SELECT timestamp, user_message, assistant_response, session_id,"
+                " context_hash, metadata FROM memories"
+                " ORDER BY timestamp DESC LIMIT ?",
+                (self.max_history,),
+            ).fetchall()
+            self.persistent_memory = deque(
+                (
+                    MemoryEntry(
+                        timestamp=timestamp,
+                        user_message=user_message,
+                        assistant_response=assistant_response,
+                        session_id=session_id,
+                        context_hash=context_hash,
+                        metadata=json.loads(metadata) if metadata else {},
+                    )
+                    for timestamp, user_message, assistant_response, session_id, context_hash, metadata in reversed(
+                        rows
+                    )
+                ),
+                maxlen=self.max_history,
+            )
         except Exception as e:
-            print(f"Warning: Could not save persistent memory: {e}")
+            print(f"Warning: Could not load persistent memory: {e}")
+            self.persistent_memory = deque(maxlen=self.max_history)
 
-    def _cleanup_old_memories(self) -> None:
-        """Remove old memories beyond the maximum limit."""
-        if len(self.persistent_memory) > self.max_history:
-            # Sort by timestamp and keep the most recent
-            self.persistent_memory.sort(key=lambda x: x.timestamp, reverse=True)
-            self.persistent_memory = self.persistent_memory[: self.max_history]
+    def _insert_entry(self, entry: MemoryEntry) -> None:
+        """Persist one entry as a single prepared INSERT.
+
+        Replaces the old full-file JSON rewrite, which re-serialized every
+        stored entry on each interaction.
+        """
+        try:
+            self._db.execute(self._INSERT_SQL, self._entry_row(entry))
+            self._db.commit()
+        except Exception as e:
+            print(f"Warning: Could not save memory entry: {e}")
+
+    def _evict_entries(self, dropped: List[MemoryEntry]) -> None:
+        """Unindex entries evicted from persistent memory and prune the DB.
+
+        The bounded deque handles the in-memory eviction itself; this
+        only cleans up the keyword index (entries still held by the
+        current session stay searchable) and trims old database rows.
+        """
+        session_ids = {id(e) for e in self.current_session_memory}
+        for entry in dropped:
+            # Freeing the hash lets an evicted pair be stored again later
+            self._seen_hashes.discard(entry.context_hash)
+            if id(entry) not in session_ids:
+                self._unindex_keywords(entry)
+                if self._semantic_index is not None:
+                    self._unindex_entry(entry)
+        try:
+            self._db.execute(
+                "DELETE FROM memories WHERE id NOT IN ("
+                "SELECT id FROM memories ORDER BY timestamp DESC LIMIT ?)",
+                (self.max_history,),
+            )
+            self._db.commit()
+        except Exception as e:
+            print(f"Warning: Could not prune memory database: {e}")
 
     def add_interaction(
         self,
@@ -90,23 +334,59 @@ class MemoryManager:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Add a new interaction to memory."""
+        context_hash = self._generate_context_hash(user_message + assistant_response)
+        # Identical pairs are already stored; skip the duplicate instead
+        # of paying indexing and a database write for it again
+        if context_hash in self._seen_hashes:
+            return
+
         entry = MemoryEntry(
             timestamp=time.time(),
             user_message=user_message,
             assistant_response=assistant_response,
             session_id=session_id,
-            context_hash=self._generate_context_hash(user_message + assistant_response),
+            context_hash=context_hash,
             metadata=metadata or {},
         )
+        self._seen_hashes.add(context_hash)
 
         # Add to current session
         self.current_session_memory.append(entry)
 
-        # Add to persistent memory if cross-session memory is enabled
+        # Index once for keyword search, and for semantic retrieval when
+        # available
+        self._index_keywords(entry)
+        if self._semantic_index is not None:
+            self._index_entry(entry)
+
+        # Add to persistent memory if cross-session memory is enabled;
+        # the deque evicts the oldest entry in O(1) once at capacity
         if self.enable_cross_session:
+            evicted = (
+                self.persistent_memory[0]
+                if len(self.persistent_memory) == self.max_history
+                else None
+            )
             self.persistent_memory.append(entry)
-            self._cleanup_old_memories()
-            self._save_persistent_memory()
+            self._insert_entry(entry)
+            if evicted is not None:
+                self._evict_entries([evicted])
+
+    def iter_all_memories(self):
+        """Yield each stored entry exactly once.
+
+        With cross-session memory on, add_interaction appends the same
+        entry to both the session and persistent lists; consumers that
+        used to concatenate the two scanned (and reported) it twice.
+        """
+        seen: set = set()
+        for entry in itertools.chain(
+            self.current_session_memory, self.persistent_memory
+        ):
+            key = id(entry)
+            if key not in seen:
+                seen.add(key)
+                yield entry
 
     def get_session_history(
         self, session_id: str, limit: Optional[int] = None
@@ -125,40 +405,62 @@ class MemoryManager:
 
     def search_memory(self, query: str, limit: int = 5) -> List[MemoryEntry]:
         """Search memory for relevant past interactions."""
+        # Prefer the embedding index: ANN lookup instead of a linear scan
+        # over every stored interaction, with better semantic recall
+        if self._semantic_index is not None and len(self._semantic_index) > 0:
+            # Over-fetch past the tombstoned rows, then keep live hits
+            hits = self._semantic_index.search(
+                query, k=limit + self._semantic_dead
+            )
+            results = []
+            for _, row in hits:
+                entry = self._indexed_entries[row]
+                if entry is not None:
+                    results.append(entry)
+                    if len(results) == limit:
+                        break
+            return results
+
         query_lower = query.lower()
+        query_words = frozenset(query_lower.split())
+        # One compiled matcher reused across all candidates; re's C scan
+        # avoids the per-call setup of str.__contains__ in this loop
+        query_pat = re.compile(re.escape(query_lower))
         relevant_memories = []
 
-        # Combine current session and persistent memory
-        all_memories = self.current_session_memory + self.persistent_memory
-
-        # Simple keyword-based search (can be enhanced with semantic search)
-        for entry in all_memories:
+        # Candidate rows from the inverted index: only entries sharing at
+        # least one query token get scored, instead of the whole store
+        candidates: set = set()
+        for token in query_words:
+            postings = self._token_index.get(token)
+            if postings:
+                candidates.update(postings)
+
+        # Simple keyword-based scoring (can be enhanced with semantic search)
+        for row in candidates:
+            entry = self._keyword_entries[row]
+            if entry is None:  # Tombstoned by cleanup
+                continue
             score = 0
 
-            # Check user message
-            if query_lower in entry.user_message.lower():
+            # Check user message (lowercased once at construction)
+            if query_pat.search(entry._lower_user):
                 score += 1
 
             # Check assistant response
-            if query_lower in entry.assistant_response.lower():
+            if query_pat.search(entry._lower_resp):
                 score += 0.5
 
-            # Check for word overlap
-            query_words = set(query_lower.split())
-            message_words = set(entry.user_message.lower().split())
-            response_words = set(entry.assistant_response.lower().split())
-
-            word_overlap = len(
-                query_words.intersection(message_words.union(response_words))
-            )
+            # Check for word overlap against the precomputed word set
+            word_overlap = len(query_words & entry._words)
             score += word_overlap * 0.1
 
             if score > 0:
                 relevant_memories.append((score, entry))
 
-        # Sort by relevance and return top results
-        relevant_memories.sort(key=lambda x: x[0], reverse=True)
-        return [entry for score, entry in relevant_memories[:limit] if score >= 0.1]
+        # Top-k selection: O(N log k) instead of sorting every scored entry
+        top = heapq.nlargest(limit, relevant_memories, key=lambda x: x[0])
+        return [entry for score, entry in top if score >= 0.1]
 
     def get_context_for_query(self, query: str, session_id: str) -> str:
         """Get relevant context for a query from memory."""
@@ -188,11 +490,23 @@ class MemoryManager:
 
     def clear_session_memory(self, session_id: str) -> None:
         """Clear memory for a specific session."""
+        removed = [
+            entry
+            for entry in self.current_session_memory
+            if entry.session_id == session_id
+        ]
         self.current_session_memory = [
             entry
             for entry in self.current_session_memory
             if entry.session_id != session_id
         ]
+        # Entries also held in persistent memory stay searchable
+        persistent_ids = {id(e) for e in self.persistent_memory}
+        for entry in removed:
+            if id(entry) not in persistent_ids:
+                self._unindex_keywords(entry)
+                if self._semantic_index is not None:
+                    self._unindex_entry(entry)
 
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get statistics about memory usage."""
@@ -221,22 +535,44 @@ class MemoryManager:
 
     def export_memory(self, filepath: str) -> None:
         """Export memory to a JSON file."""
-        all_memories = self.current_session_memory + self.persistent_memory
-        data = [asdict(entry) for entry in all_memories]
+        # to_dict covers only the persisted fields, so the derived
+        # underscore fields never reach the export and imports round-trip
+        data = [entry.to_dict() for entry in self.iter_all_memories()]
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(data))
 
     def import_memory(self, filepath: str) -> None:
         """Import memory from a JSON file."""
-        with open(filepath, "r") as f:
-            data = json.load(f)
-            imported_memories = [MemoryEntry(**entry) for entry in data]
-
-            # Add to persistent memory
-            self.persistent_memory.extend(imported_memories)
-            self._cleanup_old_memories()
-            self._save_persistent_memory()
+        data = orjson.loads(Path(filepath).read_bytes())
+        imported_memories = [
+            entry
+            for entry in (MemoryEntry(**item) for item in data)
+            if entry.context_hash not in self._seen_hashes
+        ]
+        self._seen_hashes.update(entry.context_hash for entry in imported_memories)
+
+        # Add to persistent memory; the bounded deque drops the oldest
+        # entries itself, so capture what it evicts for unindexing
+        before = list(self.persistent_memory)
+        self.persistent_memory.extend(imported_memories)
+        for entry in imported_memories:
+            self._index_keywords(entry)
+            if self._semantic_index is not None:
+                self._index_entry(entry)
+        survivors = {id(e) for e in self.persistent_memory}
+        dropped = [
+            entry
+            for entry in before + imported_memories
+            if id(entry) not in survivors
+        ]
+        self._db.executemany(
+            self._INSERT_SQL,
+            [self._entry_row(entry) for entry in imported_memories],
+        )
+        self._db.commit()
+        if dropped:
+            self._evict_entries(dropped)
 
 
 def get_memory_manager() -> MemoryManager:
@@ -264,10 +600,41 @@ Please use the above context to provide a more informed and personalized respons
     return f"Current user query: {query}"
 
 
+# Extraction patterns folded into one alternation, so each message is
+# scanned once in C instead of once per pattern
+_PROFILE_RE = re.compile(
+    r"my name is\s+(?P<name>\w+)"
+    r"|i (?:like|prefer)\s+(?P<preference>.+)"
+    r"|(?:interested in|working on)\s+(?P<interest>.+)"
+)
+
+# Extracted profiles keyed by (session_id, memory count): repeat profile
+# lookups within a session skip the full memory scan until new
+# interactions land
+_user_info_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_USER_INFO_CACHE_MAX = 64
+
+
 def extract_user_info_from_memory(
     memory_manager: MemoryManager, session_id: str
 ) -> Dict[str, Any]:
     """Extract user information and preferences from memory."""
+    # Get all memories for analysis, each entry once (cross-session mode
+    # stores session entries in the persistent list as well)
+    session_ids = {
+        id(e) for e in memory_manager.get_session_history(session_id)
+    }
+    all_memories = memory_manager.get_session_history(session_id) + [
+        entry
+        for entry in memory_manager.persistent_memory
+        if id(entry) not in session_ids
+    ]
+
+    cache_key = (session_id, len(all_memories))
+    cached = _user_info_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     user_info = {
         "name": None,
         "preferences": [],
@@ -275,33 +642,22 @@ def extract_user_info_from_memory(
         "previous_topics": [],
     }
 
-    # Get all memories for analysis
-    all_memories = (
-        memory_manager.get_session_history(session_id)
-        + memory_manager.persistent_memory
-    )
-
-    # Simple extraction logic (can be enhanced with NLP)
+    # Simple extraction logic (can be enhanced with NLP); the lowercase
+    # text is already computed per entry, so each message costs one
+    # finditer pass over the combined pattern
     for memory in all_memories:
-        user_msg = memory.user_message.lower()
-
-        # Extract name
-        if "my name is" in user_msg:
-            name_part = user_msg.split("my name is")[-1].strip().split()[0]
-            user_info["name"] = name_part.capitalize()
-
-        # Extract preferences
-        if "i like" in user_msg or "i prefer" in user_msg:
-            preference = user_msg.split(
-                "i like" if "i like" in user_msg else "i prefer"
-            )[-1].strip()
-            user_info["preferences"].append(preference)
-
-        # Extract interests
-        if "interested in" in user_msg or "working on" in user_msg:
-            interest = user_msg.split(
-                "interested in" if "interested in" in user_msg else "working on"
-            )[-1].strip()
-            user_info["interests"].append(interest)
-
+        for match in _PROFILE_RE.finditer(memory._lower_user):
+            name = match.group("name")
+            if name:
+                user_info["name"] = name.capitalize()
+                continue
+            preference = match.group("preference")
+            if preference:
+                user_info["preferences"].append(preference.strip())
+                continue
+            user_info["interests"].append(match.group("interest").strip())
+
+    if len(_user_info_cache) >= _USER_INFO_CACHE_MAX:
+        _user_info_cache.pop(next(iter(_user_info_cache)))
+    _user_info_cache[cache_key] = user_info
     return user_info
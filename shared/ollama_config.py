@@ -1,17 +1,66 @@
 """Ollama configuration and utilities."""
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# dotenv is imported (and .env applied) on first config construction
+# rather than at module import, keeping cold starts that never touch
+# Ollama config from paying for it
+_dotenv_loaded = False
+
+
+def _load_env_once() -> None:
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _dotenv_loaded = True
+
+# Status probes hit /api/version and /api/tags; health checks chain them
+# and dashboards poll, so results are held for a short TTL. Values are
+# (expiry, result) keyed by probe + endpoint, matching the cache idiom
+# used elsewhere in the tree.
+_STATUS_TTL = 10.0  # seconds
+_status_cache: Dict[tuple, tuple] = {}
+
+# Shared keep-alive session so repeated probes reuse the TCP connection
+# instead of paying a handshake per call; created on first use because
+# requests stays a lazy import in this module
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        import requests
+
+        _session = requests.Session()
+    return _session
+
+
+def _status_cache_get(key: tuple) -> Optional[Any]:
+    entry = _status_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        del _status_cache[key]
+        return None
+    return entry[1]
+
+
+def _status_cache_put(key: tuple, value: Any) -> None:
+    _status_cache[key] = (time.monotonic() + _STATUS_TTL, value)
 
 
 class OllamaConfig:
     """Configuration class for Ollama integration."""
 
     def __init__(self):
+        _load_env_once()
         self.api_base = os.getenv("OLLAMA_API_BASE", "http://localhost:11434")
         self.default_model = os.getenv("DEFAULT_MODEL", "ollama_chat/mistral-small:7b")
         self.temperature = float(os.getenv("MODEL_TEMPERATURE", "0.7"))
@@ -28,20 +77,31 @@ class OllamaConfig:
         }
 
     def validate_model_availability(self) -> bool:
-        """Check if the configured model is available in Ollama."""
-        try:
-            import requests
+        """Check if the configured model is available in Ollama.
 
-            response = requests.get(f"{self.api_base}/api/tags")
+        Cached for a short TTL so repeated health checks reuse the last
+        probe instead of re-querying /api/tags.
+        """
+        cache_key = ("model_available", self.api_base, self.default_model)
+        cached = _status_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = _get_session().get(f"{self.api_base}/api/tags")
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 model_name = self.default_model.replace("ollama_chat/", "")
-                return any(
+                available = any(
                     model.get("name", "").startswith(model_name) for model in models
                 )
-            return False
+            else:
+                available = False
         except Exception:
-            return False
+            return False  # Don't cache transport failures
+
+        _status_cache_put(cache_key, available)
+        return available
 
     def get_recommended_models(self) -> list[str]:
         """Get list of recommended models for MacBook Air M3 16GB."""
@@ -68,10 +128,19 @@ def get_ollama_config() -> OllamaConfig:
 
 
 def check_ollama_status() -> Dict[str, Any]:
-    """Check Ollama service status and available models."""
+    """Check Ollama service status and available models.
+
+    Cached for a short TTL; chained health checks within the window
+    reuse one probe.
+    """
     import requests
 
     config = get_ollama_config()
+    cache_key = ("status", config.api_base, config.default_model)
+    cached = _status_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     status = {
         "service_running": False,
         "api_accessible": False,
@@ -80,15 +149,24 @@ def check_ollama_status() -> Dict[str, Any]:
         "error": None,
     }
 
+    session = _get_session()
     try:
-        # Check if Ollama service is running
-        response = requests.get(f"{config.api_base}/api/version", timeout=5)
+        # The version and tags endpoints are independent, so probe them
+        # concurrently: the health check pays one round-trip, not two
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            version_future = pool.submit(
+                session.get, f"{config.api_base}/api/version", timeout=5
+            )
+            models_future = pool.submit(
+                session.get, f"{config.api_base}/api/tags", timeout=5
+            )
+            response = version_future.result()
+            models_response = models_future.result()
+
         if response.status_code == 200:
             status["service_running"] = True
             status["api_accessible"] = True
 
-            # Get available models
-            models_response = requests.get(f"{config.api_base}/api/tags")
             if models_response.status_code == 200:
                 models_data = models_response.json()
                 status["available_models"] = [
@@ -103,9 +181,12 @@ def check_ollama_status() -> Dict[str, Any]:
 
     except requests.RequestException as e:
         status["error"] = str(e)
+        return status  # Don't cache transport failures
     except Exception as e:
         status["error"] = f"Unexpected error: {str(e)}"
+        return status
 
+    _status_cache_put(cache_key, status)
     return status
 
 
@@ -0,0 +1,132 @@
+"""Optional semantic index for memory search.
+
+Uses sentence-transformers embeddings over a FAISS inner-product index when
+those packages are installed (install with: uv add 'ai-agents[semantic]').
+Callers fall back to keyword search when the dependencies are missing.
+"""
+
+import logging
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+ENCODE_BATCH_SIZE = 32
+
+
+class SemanticMemoryIndex:
+    """In-RAM FAISS index over memory entry texts.
+
+    Texts are buffered and encoded in batches (flushed on search or when the
+    buffer fills), so repeated single-entry adds do not pay one model
+    invocation each.
+    """
+
+    def __init__(self):
+        import faiss
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+
+        from . import sim_kernels
+
+        self._faiss = faiss
+        self._np = np
+        self._sim_kernels = sim_kernels
+        self._model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        self._index = faiss.IndexFlatIP(EMBEDDING_DIM)
+        # int8-quantized embeddings (plus per-row scales) kept alongside the
+        # index for the small-store direct-scoring path: a quarter of the
+        # FP32 footprint (see sim_kernels.SMALL_STORE_THRESHOLD)
+        self._codes = np.empty((0, EMBEDDING_DIM), dtype=np.int8)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._pending: List[str] = []  # Texts waiting for batch encoding
+
+    def __len__(self) -> int:
+        return self._index.ntotal + len(self._pending)
+
+    def reset(self) -> None:
+        """Drop every indexed row, keeping the loaded model.
+
+        Used by the memory manager to compact away tombstoned rows; the
+        caller re-adds the live texts afterwards.
+        """
+        self._index.reset()
+        self._codes = self._np.empty((0, EMBEDDING_DIM), dtype=self._np.int8)
+        self._scales = self._np.empty(0, dtype=self._np.float32)
+        self._pending.clear()
+
+    def add(self, text: str) -> None:
+        """Queue a text for indexing.
+
+        Adds are O(1) appends; encoding happens in one coalesced model call
+        at the next flush, so write paths never block on the encoder.
+        """
+        self._pending.append(text)
+
+    def flush(self) -> None:
+        """Encode and index all pending texts in one batched model call."""
+        if not self._pending:
+            return
+        embeddings = self._model.encode(
+            self._pending,
+            batch_size=ENCODE_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+        embeddings = embeddings.astype("float32")
+        self._index.add(embeddings)
+        codes, scales = self._sim_kernels.quantize_rows(embeddings)
+        self._codes = self._np.vstack((self._codes, codes))
+        self._scales = self._np.concatenate((self._scales, scales))
+        self._pending.clear()
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[float, int]]:
+        """Find the k nearest indexed texts for a query.
+
+        Returns:
+            List of (score, row) pairs, best first. Rows refer to texts in
+            the order they were added.
+        """
+        self.flush()
+        if self._index.ntotal == 0:
+            return []
+
+        query_embedding = self._model.encode(
+            [query], normalize_embeddings=True, convert_to_numpy=True
+        ).astype("float32")
+
+        # Small stores: score directly against the raw matrix; FAISS's
+        # per-query setup cost dominates below the threshold
+        if self._index.ntotal < self._sim_kernels.SMALL_STORE_THRESHOLD:
+            all_scores = self._sim_kernels.quantized_scores(
+                self._codes, self._scales, query_embedding[0]
+            )
+            best = self._sim_kernels.top_k_rows(
+                all_scores, min(k, self._index.ntotal)
+            )
+            return [(float(all_scores[row]), int(row)) for row in best]
+
+        scores, rows = self._index.search(
+            query_embedding, min(k, self._index.ntotal)
+        )
+        return [
+            (float(score), int(row))
+            for score, row in zip(scores[0], rows[0])
+            if row >= 0
+        ]
+
+
+def create_semantic_index() -> "SemanticMemoryIndex | None":
+    """Create a SemanticMemoryIndex, or None if optional deps are missing."""
+    try:
+        return SemanticMemoryIndex()
+    except ImportError:
+        logger.info(
+            "sentence-transformers/faiss not installed; memory search will "
+            "use the keyword scan"
+        )
+        return None
+    except Exception as e:
+        logger.warning(f"Could not initialize semantic index: {e}")
+        return None
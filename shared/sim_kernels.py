@@ -0,0 +1,60 @@
+"""Similarity kernels for small in-memory vector stores.
+
+For stores with fewer than ~1000 vectors the fixed per-query overhead of a
+FAISS search dominates, and a direct matrix-vector product over the stored
+embeddings is faster. Rows are kept as int8 scalar-quantized codes with one
+float32 scale each, so the resident matrix is a quarter the size of FP32.
+When numba is installed the scoring loop is JIT-compiled (LLVM
+auto-vectorizes the dot products); otherwise the BLAS-backed numpy product
+is used. Vectors are assumed L2-normalized, so the inner product equals the
+cosine similarity.
+"""
+
+import numpy as np
+
+# Below this many stored vectors, skip FAISS and score directly
+SMALL_STORE_THRESHOLD = 1000
+
+
+def quantize_rows(mat: np.ndarray) -> tuple:
+    """Scalar-quantize rows to int8 codes plus one float32 scale per row."""
+    scales = np.maximum(np.abs(mat).max(axis=1), 1e-12).astype(np.float32)
+    codes = np.round(mat * (127.0 / scales[:, None])).astype(np.int8)
+    return codes, scales
+
+
+try:
+    from numba import njit, prange
+
+    @njit(
+        "f4[::1](i1[:,::1], f4[::1], f4[::1])",
+        fastmath=True,
+        parallel=True,
+        cache=True,
+    )
+    def quantized_scores(codes, scales, q):
+        n, d = codes.shape
+        inv = np.float32(1.0 / 127.0)
+        out = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            s = np.float32(0.0)
+            for j in range(d):
+                s += np.float32(codes[i, j]) * q[j]
+            out[i] = s * scales[i] * inv
+        return out
+
+except ImportError:
+
+    def quantized_scores(
+        codes: np.ndarray, scales: np.ndarray, q: np.ndarray
+    ) -> np.ndarray:
+        """Inner-product scores of a query against int8-coded rows."""
+        return (codes.astype(np.float32) @ q) * (scales * np.float32(1.0 / 127.0))
+
+
+def top_k_rows(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the indices of the k highest scores, best first."""
+    if k >= scores.shape[0]:
+        return np.argsort(scores)[::-1]
+    part = np.argpartition(scores, -k)[-k:]
+    return part[np.argsort(scores[part])[::-1]]
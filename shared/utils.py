@@ -1,6 +1,8 @@
 """Common utilities for AI agents."""
 
+import functools
 import os
+import threading
 import time
 import logging
 import uuid
@@ -21,9 +23,27 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     return logging.getLogger(__name__)
 
 
+# Random bytes for session IDs are drawn from the OS in 4 KiB batches;
+# uuid4() pays a urandom syscall per call, the buffer amortizes it over
+# 256 IDs. The lock keeps concurrent refills from racing.
+_RNG_BATCH = 4096
+_rng_lock = threading.Lock()
+_rng_buf = b""
+_rng_pos = 0
+
+
 def generate_session_id() -> str:
-    """Generate a unique session ID."""
-    return str(uuid.uuid4())
+    """Generate a unique session ID (canonical UUID4 form)."""
+    global _rng_buf, _rng_pos
+    with _rng_lock:
+        if _rng_pos >= len(_rng_buf):
+            _rng_buf = os.urandom(_RNG_BATCH)
+            _rng_pos = 0
+        raw = _rng_buf[_rng_pos : _rng_pos + 16]
+        _rng_pos += 16
+    # version=4 sets the version/variant bits, so the result is
+    # indistinguishable from uuid.uuid4()
+    return str(uuid.UUID(bytes=raw, version=4))
 
 
 def get_timestamp() -> float:
@@ -31,13 +51,28 @@ def get_timestamp() -> float:
     return time.time()
 
 
+@functools.lru_cache(maxsize=1024)
+def _format_second(ts_int: int) -> str:
+    """strftime for one integer-second bucket, cached.
+
+    The display format has second resolution, so bursts of responses
+    within the same second share one localtime+strftime call.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_int))
+
+
 def format_timestamp(timestamp: float) -> str:
     """Format timestamp for display."""
-    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+    return _format_second(int(timestamp))
 
 
 def sanitize_input(text: str, max_length: int = 1000) -> str:
-    """Sanitize user input."""
+    """Sanitize user input.
+
+    Deliberately regex-free: a strip plus a length cap is one O(n) pass in C
+    with no backtracking. If pattern-based redaction is ever added here,
+    compile the patterns once at module level rather than per call.
+    """
     if not text:
         return ""
 
@@ -131,6 +166,22 @@ def estimate_token_count(text: str) -> int:
     return len(text) // 4
 
 
+def estimate_token_counts(texts: List[str]) -> List[int]:
+    """Estimate token counts for a batch of texts.
+
+    One vectorized division via numpy when it is installed (the semantic
+    extra pulls it in) instead of a Python divide per text; falls back to
+    a plain comprehension otherwise.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [len(text) // 4 for text in texts]
+
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    return (lengths // 4).tolist()
+
+
 def check_system_resources() -> Dict[str, Any]:
     """Check system resources and provide recommendations."""
     import psutil
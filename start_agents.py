@@ -15,11 +15,18 @@
 
 """Start script for both Base AI Agent and Google Search Agent."""
 
+import argparse
+import functools
 import os
+import selectors
+import signal
+import socket
 import sys
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import time
-import signal
 import threading
 import platform
 from pathlib import Path
@@ -43,25 +50,56 @@ def print_banner():
     print(banner)
 
 
+@functools.lru_cache(maxsize=None)
+def _probe_command(*cmd):
+    """Run one external probe, reporting whether it succeeded.
+
+    Cached so re-entering the requirements check never re-forks.
+    """
+    try:
+        subprocess.run(cmd, capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+def _ollama_running():
+    """Check Ollama liveness over HTTP instead of forking `ollama list`.
+
+    `ollama list` scans the models directory and costs a couple hundred
+    ms even warm; a GET against /api/tags answers the same question in
+    one localhost round-trip. The CLI probe remains as a fallback when
+    nothing answers on the default port, to cover non-default endpoints.
+    """
+    try:
+        with urllib.request.urlopen(
+            "http://127.0.0.1:11434/api/tags", timeout=0.5
+        ) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return _probe_command("ollama", "list")
+
+
 def check_requirements():
     """Check if all requirements are met."""
     errors = []
 
-    # Check if .env file exists
-    if not Path(".env").exists():
-        errors.append(".env file not found")
+    # The uv and ollama probes are independent and each pay a fork or a
+    # network round-trip, so run them concurrently while the .env check
+    # happens inline
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        uv_ok = pool.submit(_probe_command, "uv", "--version")
+        ollama_ok = pool.submit(_ollama_running)
 
-    # Check if UV is available
-    try:
-        subprocess.run(["uv", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        errors.append("UV is not installed or not available in PATH")
+        # Check if .env file exists
+        if not Path(".env").exists():
+            errors.append(".env file not found")
 
-    # Check if Ollama is running (cross-platform)
-    try:
-        subprocess.run(["ollama", "list"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        errors.append("Ollama is not running or not available")
+        if not uv_ok.result():
+            errors.append("UV is not installed or not available in PATH")
+
+        if not ollama_ok.result():
+            errors.append("Ollama is not running or not available")
 
     return errors
 
@@ -71,108 +109,217 @@ def is_windows():
     return platform.system() == "Windows"
 
 
+# Venv paths resolved once per launcher run: every `uv run` re-resolves
+# the environment before exec'ing, which costs hundreds of ms per spawn
+# on some platforms; spawning the resolved executables skips that.
+_venv_paths = None
+
+
+def resolve_venv():
+    """Locate the venv's python and adk executables, one uv call total.
+
+    Returns (python_exe, adk_exe); either may be None, in which case the
+    caller falls back to going through `uv run`.
+    """
+    global _venv_paths
+    if _venv_paths is None:
+        try:
+            out = subprocess.run(
+                [
+                    "uv",
+                    "run",
+                    "python",
+                    "-c",
+                    "import shutil, sys;"
+                    " print(sys.executable);"
+                    " print(shutil.which('adk') or '')",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=60,
+            )
+            lines = out.stdout.strip().splitlines() + ["", ""]
+            _venv_paths = (lines[0] or None, lines[1] or None)
+        except Exception:
+            _venv_paths = (None, None)
+    return _venv_paths
+
+
+# Popen configuration shared by every launch, resolved once at import
+# (including the Windows-only process-group flag, which used to be
+# re-branched inside each start_* function). bufsize=1 keeps the text
+# pipes line-buffered for the monitor paths.
+_POPEN_KW = dict(
+    stdout=subprocess.PIPE,
+    stderr=subprocess.STDOUT,
+    universal_newlines=True,
+    bufsize=1,
+)
+if platform.system() == "Windows":
+    _POPEN_KW["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+
+# Set from --quiet: children write to DEVNULL and no monitoring runs
+_quiet = False
+
+_F_SETPIPE_SZ = 1031  # Linux-only fcntl op, not exposed by the fcntl module
+
+
+def _widen_pipe(process):
+    """Grow a child's stdout pipe to 1 MiB (Linux only).
+
+    The default 64 KiB pipe lets a bursty child block on write while the
+    launcher is busy elsewhere; a bigger kernel buffer absorbs the burst.
+    Best effort — other platforms and denied fcntl calls are ignored.
+    """
+    if platform.system() != "Linux":
+        return
+    try:
+        import fcntl
+
+        fcntl.fcntl(process.stdout.fileno(), _F_SETPIPE_SZ, 1 << 20)
+    except (ImportError, OSError):
+        pass
+
+
+def _spawn(cmd):
+    """Start one child process with the shared pipe configuration."""
+    if _quiet:
+        kw = dict(
+            _POPEN_KW, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return subprocess.Popen(cmd, **kw)
+    process = subprocess.Popen(cmd, **_POPEN_KW)
+    _widen_pipe(process)
+    return process
+
+
 def start_a2a_server():
     """Start the Google Search Agent A2A server."""
     print("🔍 Starting Google Search Agent A2A Server...")
 
-    cmd = [
-        "uv",
-        "run",
-        "python",
-        "google-search-agent/a2a_server.py",
-    ]
-
-    # On Windows, we need to handle process creation differently
-    if is_windows():
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-        )
-    else:
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-        )
+    python_exe, _ = resolve_venv()
+    cmd = (
+        [python_exe] if python_exe else ["uv", "run", "python"]
+    ) + ["google-search-agent/a2a_server.py"]
+    return _spawn(cmd)
 
 
 def start_web_scraper_agent():
     """Start the Web Scraper Agent A2A server."""
     print("🌐 Starting Web Scraper Agent A2A Server...")
 
-    cmd = [
-        "uv",
-        "run",
-        "python",
-        "web-scraper-agent/a2a_server.py",
-    ]
-
-    # On Windows, we need to handle process creation differently
-    if is_windows():
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-        )
-    else:
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-        )
+    python_exe, _ = resolve_venv()
+    cmd = (
+        [python_exe] if python_exe else ["uv", "run", "python"]
+    ) + ["web-scraper-agent/a2a_server.py"]
+    return _spawn(cmd)
 
 
 def start_web_interface():
     """Start the Base AI Agent web interface."""
     print("🌐 Starting Base AI Agent Web Interface...")
 
-    cmd = [
-        "uv",
-        "run",
-        "adk",
+    _, adk_exe = resolve_venv()
+    cmd = ([adk_exe] if adk_exe else ["uv", "run", "adk"]) + [
         "web",
         "--port",
         "8000",
         "--host",
         "127.0.0.1",
     ]
+    return _spawn(cmd)
 
-    # On Windows, we need to handle process creation differently
-    if is_windows():
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-        )
-    else:
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-        )
+
+def wait_for_port(port, timeout=15.0):
+    """Poll until a local TCP port accepts connections, or time out.
+
+    Replaces the fixed startup sleeps: warm machines proceed as soon as
+    the server binds (tens of ms) and cold machines get the full
+    timeout instead of a too-short fixed wait.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
 
 
 def monitor_process(process, name):
-    """Monitor a process and print its output."""
+    """Monitor a process and print its output (Windows thread path).
+
+    Lines are batched and written in one stdout call every 16 lines or
+    50 ms: with three chatty children, per-line print calls contend on
+    the stdout lock and flush once per line.
+    """
+    buf = []
+    last = time.monotonic()
     try:
         for line in process.stdout:
-            print(f"[{name}] {line.strip()}")
+            buf.append(f"[{name}] {line.strip()}\n")
+            if len(buf) >= 16 or time.monotonic() - last > 0.05:
+                sys.stdout.write("".join(buf))
+                sys.stdout.flush()
+                buf.clear()
+                last = time.monotonic()
     except Exception:
         pass
+    finally:
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+
+
+def pump_output(processes):
+    """Forward all child output from a single selector loop (POSIX).
+
+    One loop on the main thread replaces a blocked reader thread per
+    child: idle children cost nothing, and the loop doubles as the
+    wait-for-exit loop. Returns when every child has closed its stdout.
+    """
+    sel = selectors.DefaultSelector()
+    for name, process in processes:
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        sel.register(fd, selectors.EVENT_READ, data=name)
+
+    try:
+        while sel.get_map():
+            for key, _ in sel.select(timeout=0.5):
+                try:
+                    chunk = os.read(key.fd, 4096)
+                except OSError:
+                    chunk = b""
+                if chunk:
+                    # One write+flush per chunk, not one print per line
+                    sys.stdout.write(
+                        "".join(
+                            f"[{key.data}] {line.strip()}\n"
+                            for line in chunk.decode(errors="replace").splitlines()
+                        )
+                    )
+                    sys.stdout.flush()
+                else:  # EOF: the child exited or closed stdout
+                    sel.unregister(key.fd)
+    finally:
+        sel.close()
 
 
 def main():
     """Main entry point."""
+    global _quiet
+
+    parser = argparse.ArgumentParser(description="Start the AI agent system")
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Discard agent output instead of forwarding it to this console",
+    )
+    _quiet = parser.parse_args().quiet
+
     print_banner()
 
     # Check requirements
@@ -193,31 +340,36 @@ def main():
     processes = []
 
     try:
-        # Start A2A server first
-        a2a_process = start_a2a_server()
-        processes.append(("Google Search Agent", a2a_process))
-
-        # Wait a bit for A2A server to start
-        time.sleep(3)
-
-        # Start web scraper agent
-        scraper_process = start_web_scraper_agent()
-        processes.append(("Web Scraper Agent", scraper_process))
-
-        # Wait a bit for web scraper agent to start
-        time.sleep(3)
-
-        # Start web interface
-        web_process = start_web_interface()
-        processes.append(("Web Interface", web_process))
-
-        # Start monitoring threads
-        threads = []
-        for name, process in processes:
-            thread = threading.Thread(target=monitor_process, args=(process, name))
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
+        # The three services are independent, so spawn them back-to-back
+        # and overlap their startup: total launch time is the slowest
+        # service, not the sum of all three
+        processes.append(("Google Search Agent", start_a2a_server()))
+        processes.append(("Web Scraper Agent", start_web_scraper_agent()))
+        processes.append(("Web Interface", start_web_interface()))
+
+        service_ports = [
+            ("Google Search Agent", 8001),
+            ("Web Scraper Agent", 8002),
+            ("Web Interface", 8000),
+        ]
+        with ThreadPoolExecutor(max_workers=len(service_ports)) as pool:
+            readiness = list(
+                pool.map(lambda item: wait_for_port(item[1]), service_ports)
+            )
+        for (name, _), ready in zip(service_ports, readiness):
+            if not ready:
+                print(f"⚠️  {name} not ready yet, continuing anyway...")
+
+        # On Windows, selectors cannot poll pipes, so fall back to one
+        # reader thread per child; POSIX drains everything from a single
+        # selector loop below instead. --quiet skips monitoring entirely.
+        if is_windows() and not _quiet:
+            threads = []
+            for name, process in processes:
+                thread = threading.Thread(target=monitor_process, args=(process, name))
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
 
         print("\n🎉 All agents are starting up!")
         print("\n📋 Service URLs:")
@@ -234,21 +386,26 @@ def main():
         print("   • The base agent can delegate to both search and scraping agents!")
         print("\n⏹️  Press Ctrl+C to stop all services")
 
-        # Cross-platform signal handling
-        if is_windows():
-            # On Windows, we use a different approach
-            try:
-                while True:
-                    time.sleep(1)
-                    # Check if processes are still running
-                    if not any(p.poll() is None for _, p in processes):
-                        break
-            except KeyboardInterrupt:
-                pass
+        # Cross-platform wait loop; with --quiet there are no pipes to
+        # drain, so block on an Event instead of running the selector
+        # loop. Ctrl+C (and Ctrl+Break on Windows) sets the event via a
+        # signal handler, and a waiter thread per child sets it when a
+        # child dies — no 1-second polling wakeups either way.
+        if is_windows() or _quiet:
+            stop = threading.Event()
+            signal.signal(signal.SIGINT, lambda *_: stop.set())
+            if hasattr(signal, "SIGBREAK"):
+                signal.signal(signal.SIGBREAK, lambda *_: stop.set())
+            for _, process in processes:
+                threading.Thread(
+                    target=lambda p=process: (p.wait(), stop.set()),
+                    daemon=True,
+                ).start()
+            stop.wait()
         else:
-            # Unix-style signal handling
-            signal.signal(signal.SIGINT, lambda s, f: None)
-            signal.pause()
+            # The selector loop forwards child output until the children
+            # exit; Ctrl+C raises KeyboardInterrupt into the handler below
+            pump_output(processes)
 
     except KeyboardInterrupt:
         print("\n\n🛑 Stopping services...")
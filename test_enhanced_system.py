@@ -2,30 +2,52 @@
 """Test script for the enhanced search and scraping functionality."""
 
 import asyncio
-import os
+import importlib.util
 import sys
-import time
 from pathlib import Path
 
 # Add the project directory to the path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+
+def _load_module(name, path):
+    """Load a module from a file path, memoized in sys.modules.
+
+    Both agent packages ship an agent.py, so putting their directories
+    on sys.path would make the imports collide; loading by path under
+    distinct names sidesteps that, and the heavy google.adk import
+    behind each module still runs only once across the tests.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[name] = module
+    return module
+
+
+def _load_base_agent():
+    return _load_module("base_agent", project_root / "base-ai-agent" / "agent.py")
+
 async def test_web_scraper_agent():
     """Test the web scraper agent functionality."""
     try:
         # Import the web scraper agent
-        sys.path.insert(0, str(project_root / "web-scraper-agent"))
-        from scraper_agent_executor import WebScraperAgentExecutor
-        
+        scraper = _load_module(
+            "scraper_agent_executor",
+            project_root / "web-scraper-agent" / "scraper_agent_executor.py",
+        )
+
         print("✅ Web Scraper Agent imports successfully")
-        
+
         # Create an instance
-        executor = WebScraperAgentExecutor()
+        executor = scraper.WebScraperAgentExecutor()
         print("✅ Web Scraper Agent executor created")
-        
+
         return True
-        
+
     except Exception as e:
         print(f"❌ Web Scraper Agent test failed: {e}")
         return False
@@ -34,17 +56,16 @@ async def test_enhanced_base_agent():
     """Test the enhanced base agent functionality."""
     try:
         # Import the base agent
-        sys.path.insert(0, str(project_root / "base-ai-agent"))
-        from agent import create_base_agent, search_google, search_and_scrape
-        
+        base_agent = _load_base_agent()
+
         print("✅ Enhanced Base Agent imports successfully")
-        
+
         # Create the agent
-        agent = create_base_agent()
+        agent = base_agent.create_base_agent()
         print("✅ Enhanced Base Agent created with both search and scraping tools")
-        
+
         return True
-        
+
     except Exception as e:
         print(f"❌ Enhanced Base Agent test failed: {e}")
         return False
@@ -52,9 +73,8 @@ async def test_enhanced_base_agent():
 async def test_url_extraction():
     """Test URL extraction functionality."""
     try:
-        sys.path.insert(0, str(project_root / "base-ai-agent"))
-        from agent import _extract_urls_from_search_result
-        
+        base_agent = _load_base_agent()
+
         # Test URL extraction
         test_search_result = """
         Search results:
@@ -67,7 +87,7 @@ async def test_url_extraction():
         https://another-site.com
         """
         
-        urls = _extract_urls_from_search_result(test_search_result)
+        urls = base_agent._extract_urls_from_search_result(test_search_result)
         if urls:
             print(f"✅ URL extraction works: {len(urls)} URLs found")
             return True
@@ -90,16 +110,20 @@ async def main():
         ("URL Extraction", test_url_extraction),
     ]
     
+    for test_name, _ in tests:
+        print(f"🔍 Testing {test_name}...")
+
+    # The tests are independent, so run them concurrently; a crashed
+    # test comes back as an exception and counts as a failure
+    raw_results = await asyncio.gather(
+        *(test_func() for _, test_func in tests), return_exceptions=True
+    )
     results = []
-    
-    for test_name, test_func in tests:
-        print(f"\n🔍 Testing {test_name}...")
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            results.append((test_name, False))
+    for (test_name, _), result in zip(tests, raw_results):
+        if isinstance(result, BaseException):
+            print(f"❌ {test_name} test crashed: {result}")
+            result = False
+        results.append((test_name, result))
     
     print("\n" + "=" * 50)
     print("📊 Test Results:")
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Web Scraper Agent A2A Server."""
 
+import orjson
 import uvicorn
+from starlette.responses import JSONResponse
+
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
 from a2a.server.tasks import InMemoryTaskStore
@@ -12,6 +15,22 @@ from a2a.types import (
 )
 from scraper_agent_executor import WebScraperAgentExecutor
 
+# Serialize JSON responses with orjson: summaries can be tens of KB and
+# the stdlib encoder is pure Python. A2A doesn't expose a response-class
+# hook, so the render method is swapped on Starlette's JSONResponse,
+# keeping the stdlib path for the rare payload orjson rejects.
+_stdlib_render = JSONResponse.render
+
+
+def _orjson_render(self, content) -> bytes:
+    try:
+        return orjson.dumps(content)
+    except TypeError:
+        return _stdlib_render(self, content)
+
+
+JSONResponse.render = _orjson_render
+
 def create_web_scraper_server():
     """Create and configure the A2A server for Web Scraper Agent."""
     
@@ -42,26 +61,40 @@ def create_web_scraper_server():
     )
     
     # Create the request handler
+    executor = WebScraperAgentExecutor()
     request_handler = DefaultRequestHandler(
-        agent_executor=WebScraperAgentExecutor(),
+        agent_executor=executor,
         task_store=InMemoryTaskStore(),
     )
-    
+
     # Create the A2A server
     server = A2AStarletteApplication(
         agent_card=agent_card,
         http_handler=request_handler,
     )
-    
-    return server
+
+    return server, executor
 
 def main():
     """Start the A2A server."""
     print("🌐 Starting Web Scraper Agent A2A Server...")
     print("📋 Agent card will be available at: http://localhost:8002/.well-known/agent.json")
-    
-    server = create_web_scraper_server()
-    uvicorn.run(server.build(), host='127.0.0.1', port=8002)
+
+    # uvloop (installed via the 'perf' extra) replaces the default event
+    # loop; uvicorn's 'auto' loop would pick it up too, but install()
+    # also covers any asyncio work that runs before the server starts
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    server, executor = create_web_scraper_server()
+    app = server.build()
+    # Close the executor's pooled HTTP session cleanly on shutdown
+    app.add_event_handler('shutdown', executor.close)
+    uvicorn.run(app, host='127.0.0.1', port=8002)
 
 if __name__ == "__main__":
     main()
@@ -4,37 +4,241 @@ import asyncio
 import logging
 import os
 import re
-from typing import Any, List
+import time
+from typing import Any, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.utils import new_agent_text_message
-from google.adk.models.lite_llm import LiteLlm
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; used on the per-request path
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# Defaults for the shared HTTP session, built once at import
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; WebScraperBot/1.0)',
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Encoding': 'gzip, deflate',
+}
+_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# bs4 (plus the lxml probe) and litellm are imported on first use rather
+# than at module import: the server process starts and serves its agent
+# card without paying for them, and they cost nothing if never invoked.
+_soup_state = None
+
+
+def _get_soup_state():
+    """Import bs4, probe lxml and build the strainer, once.
+
+    Returns (BeautifulSoup, parser_name, strainer). The C-based lxml
+    backend parses large pages several times faster than the
+    pure-Python html.parser with no API difference; html.parser is the
+    fallback when lxml is not installed. The strainer only builds tree
+    nodes for the title and the content-bearing subtrees, so everything
+    else in <head> (inline scripts, styles, meta) is skipped at parse
+    time. <body> stays in the list so the selector fallback chain keeps
+    working, which means in-body boilerplate still needs the decompose
+    pass in _extract_content.
+    """
+    global _soup_state
+    if _soup_state is None:
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        try:
+            import lxml  # noqa: F401
+
+            parser = "lxml"
+        except ImportError:
+            parser = "html.parser"
+
+        strainer = SoupStrainer(
+            ['title', 'main', 'article', 'body', 'div', 'section', 'p']
+        )
+        _soup_state = (BeautifulSoup, parser, strainer)
+    return _soup_state
+
+# Candidate main-content containers, joined so one select_one pass
+# covers them all; the first match in document order wins, which for
+# real pages coincides with the old first-selector-that-hits order
+_CONTENT_SELECTOR = ', '.join([
+    'main', 'article', '.content', '#content', '.post', '.entry-content',
+    '.article-body', '.story-body', '.post-content', '.entry', '.text'
+])
+
+# Boilerplate tags removed before text extraction
+_DROP_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside', 'ads')
+
+
+class _SummaryBatcher:
+    """Coalesce concurrent summarization prompts into one model call.
+
+    Per-call scheduling overhead dominates for small prompts, so
+    requests that arrive within a short window are merged into a single
+    structured multi-document completion and each caller gets only its
+    own section back. A lone request in the window goes through
+    unmodified.
+    """
+
+    _SECTION_RE = re.compile(r'###\s*RESPONSE\s+(\d+)\s*###')
+
+    def __init__(self, complete, window: float = 0.05, max_batch: int = 4):
+        self._complete = complete  # async callable: prompt -> text
+        self._window = window
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, prompt: str) -> str:
+        """Queue one prompt and wait for its summary text."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    def close(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch) -> None:
+        if len(batch) == 1:
+            prompt, future = batch[0]
+            try:
+                future.set_result(await self._complete(prompt))
+            except Exception as e:
+                future.set_exception(e)
+            return
+
+        merged = (
+            "You will receive several independent summarization requests. "
+            "Answer each one separately, and precede answer k with the "
+            "exact line '### RESPONSE k ###'.\n\n"
+        ) + "\n\n".join(
+            f"### REQUEST {i} ###\n{prompt}"
+            for i, (prompt, _) in enumerate(batch, 1)
+        )
+        try:
+            text = await self._complete(merged)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        parts = self._SECTION_RE.split(text)
+        sections = {
+            int(index): body.strip()
+            for index, body in zip(parts[1::2], parts[2::2])
+        }
+        for i, (_, future) in enumerate(batch, 1):
+            if i in sections and sections[i]:
+                future.set_result(sections[i])
+            else:
+                # Callers fall back to their non-LLM summary path
+                future.set_exception(
+                    ValueError(f'batched summary missing section {i}')
+                )
+
 
 class WebScraperAgentExecutor(AgentExecutor):
     """Agent executor for web scraping and content summarization."""
     
     def __init__(self):
         """Initialize the Web Scraper Agent Executor."""
-        # Initialize Ollama model for content processing (more reliable than Gemini)
-        self.model = LiteLlm(
-            model="ollama_chat/llama3.1:8b",
-            api_base="http://localhost:11434",
-            temperature=0.3,
-            max_tokens=2048,
-        )
-        
+        # Ollama model for content processing (more reliable than Gemini);
+        # called through litellm.acompletion so generation doesn't park a
+        # threadpool worker
+        self.model_name = "ollama_chat/llama3.1:8b"
+        self.api_base = "http://localhost:11434"
+        self.temperature = 0.3
+        self.max_tokens = 2048
+        # Input-side cap on scraped content sent to the model, shared
+        # across however many pages a request yields
+        self._prompt_token_budget = 3000
+
+
         # Configuration
         self.max_content_length = 10000  # Maximum content length to process
-        self.timeout = 10  # Request timeout in seconds
         self.max_urls = 3  # Maximum number of URLs to scrape
-        
+        self.max_fetch_bytes = 512 * 1024  # Stop reading a page beyond this
+        self.max_page_bytes = 2 * 1024 * 1024  # Skip pages advertised larger
+
+        # Recently scraped URLs, url -> (expiry, result dict): a running
+        # server sees the same URLs in bursts, and a hit skips the fetch
+        # and parse entirely. Insertion order doubles as eviction order.
+        self._scrape_cache: dict = {}
+        self._scrape_cache_ttl = 300.0  # seconds
+        self._scrape_cache_max = 256
+
+        # HTTP session shared across execute() calls so the connection
+        # pool, DNS cache and TLS contexts survive between requests;
+        # created lazily because the constructor runs outside the loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+
+        # Merges summarization calls from concurrent requests that land
+        # within its window into one completion
+        self._batcher = _SummaryBatcher(self._complete_prompt)
+
+    async def _complete_prompt(self, prompt: str) -> str:
+        """One completion round-trip, returning the response text."""
+        import litellm  # Deferred: heavy import, only needed to summarize
+
+        response = await litellm.acompletion(
+            model=self.model_name,
+            api_base=self.api_base,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
+        if getattr(response, 'choices', None):
+            return response.choices[0].message.content
+        raise ValueError('Model returned no choices')
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=32,
+                            limit_per_host=8,
+                            ttl_dns_cache=300,
+                            keepalive_timeout=60,
+                        ),
+                        timeout=_TIMEOUT,
+                        headers=_HEADERS,
+                    )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session (server shutdown hook)."""
+        self._batcher.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     async def execute(
         self,
         context: RequestContext,
@@ -95,112 +299,170 @@ class WebScraperAgentExecutor(AgentExecutor):
                 for part in last_message.parts:
                     if hasattr(part, 'text'):
                         text = part.text.strip()
-                        # Extract URLs using regex
-                        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-                        found_urls = re.findall(url_pattern, text)
-                        urls.extend(found_urls)
+                        urls.extend(_URL_RE.findall(text))
         
         # Fallback: check for task description
         if not urls and hasattr(context, 'task') and context.task:
             if hasattr(context.task, 'description'):
                 text = context.task.description.strip()
-                url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-                found_urls = re.findall(url_pattern, text)
-                urls.extend(found_urls)
+                urls.extend(_URL_RE.findall(text))
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_urls = []
-        for url in urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
-        
-        return unique_urls
+        return list(dict.fromkeys(urls))
     
     async def _scrape_urls(self, urls: List[str]) -> List[dict]:
-        """Scrape content from the provided URLs."""
-        results = []
-        
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout),
-            headers={'User-Agent': 'Mozilla/5.0 (compatible; WebScraperBot/1.0)'}
-        ) as session:
-            
-            for url in urls:
-                try:
-                    logger.info(f"Scraping URL: {url}")
-                    
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            content_type = response.headers.get('content-type', '').lower()
-                            
-                            # Only process HTML content
-                            if 'text/html' in content_type:
-                                html_content = await response.text()
-                                extracted_content = self._extract_content(html_content, url)
-                                
-                                if extracted_content:
-                                    results.append({
-                                        'url': url,
-                                        'title': extracted_content['title'],
-                                        'content': extracted_content['content'],
-                                        'status': 'success'
-                                    })
-                                else:
-                                    results.append({
-                                        'url': url,
-                                        'status': 'failed',
-                                        'error': 'Failed to extract meaningful content'
-                                    })
-                            else:
-                                results.append({
-                                    'url': url,
-                                    'status': 'skipped',
-                                    'error': f'Unsupported content type: {content_type}'
-                                })
-                        else:
-                            results.append({
+        """Scrape content from the provided URLs concurrently.
+
+        The requests are fired together through one shared session, so
+        total wall time is the slowest URL rather than the sum of all
+        round-trips.
+        """
+        session = await self._get_session()
+        results = await asyncio.gather(
+            *(self._scrape_one(session, url) for url in urls),
+            return_exceptions=True,
+        )
+
+        return [
+            result
+            if not isinstance(result, BaseException)
+            else {'url': url, 'status': 'failed', 'error': str(result)}
+            for url, result in zip(urls, results)
+        ]
+
+    def _scrape_cache_get(self, url: str) -> Optional[dict]:
+        entry = self._scrape_cache.get(url)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del self._scrape_cache[url]
+            return None
+        return entry[1]
+
+    def _scrape_cache_put(self, url: str, result: dict) -> None:
+        while len(self._scrape_cache) >= self._scrape_cache_max:
+            self._scrape_cache.pop(next(iter(self._scrape_cache)))
+        self._scrape_cache[url] = (
+            time.monotonic() + self._scrape_cache_ttl,
+            result,
+        )
+
+    async def _scrape_one(self, session: aiohttp.ClientSession, url: str) -> dict:
+        """Scrape a single URL, mapping every failure to a result dict."""
+        cached = self._scrape_cache_get(url)
+        if cached is not None:
+            logger.info(f"Scrape cache hit: {url}")
+            return cached
+
+        try:
+            logger.info(f"Scraping URL: {url}")
+
+            # Cheap HEAD probe first: binary URLs (PDFs, images, video)
+            # and oversized pages are skipped without committing to a
+            # body read. Servers that reject HEAD fall through to GET.
+            try:
+                async with session.head(url, allow_redirects=True) as head:
+                    if head.status == 200:
+                        head_type = head.headers.get('content-type', '').lower()
+                        if head_type and 'text/html' not in head_type:
+                            return {
                                 'url': url,
-                                'status': 'failed',
-                                'error': f'HTTP {response.status}'
-                            })
-                            
-                except Exception as e:
-                    logger.error(f"Error scraping {url}: {e}")
-                    results.append({
+                                'status': 'skipped',
+                                'error': f'Unsupported content type: {head_type}'
+                            }
+                        length = head.headers.get('content-length')
+                        if length and int(length) > self.max_page_bytes:
+                            return {
+                                'url': url,
+                                'status': 'skipped',
+                                'error': f'Page too large: {length} bytes'
+                            }
+            except (aiohttp.ClientError, ValueError):
+                pass  # Probe trouble is not fatal; the GET decides
+
+            async with session.get(url) as response:
+                if response.status == 200:
+                    content_type = response.headers.get('content-type', '').lower()
+
+                    # Only process HTML content
+                    if 'text/html' in content_type:
+                        # Stream with a cap instead of buffering the whole
+                        # page: only the first max_content_length chars are
+                        # kept anyway, so a huge page should cost bounded
+                        # memory and parse time
+                        buf = bytearray()
+                        async for chunk in response.content.iter_chunked(16384):
+                            buf.extend(chunk)
+                            if len(buf) > self.max_fetch_bytes:
+                                break
+                        html_content = buf.decode(
+                            response.charset or 'utf-8', errors='replace'
+                        )
+                        # Parsing is tens of ms of CPU; run it in a thread
+                        # so concurrent scrapes keep the loop turning (lxml
+                        # releases the GIL inside its C parser)
+                        extracted_content = await asyncio.to_thread(
+                            self._extract_content, html_content, url
+                        )
+
+                        if extracted_content:
+                            result = {
+                                'url': url,
+                                'title': extracted_content['title'],
+                                'content': extracted_content['content'],
+                                'status': 'success'
+                            }
+                            self._scrape_cache_put(url, result)
+                            return result
+                        return {
+                            'url': url,
+                            'status': 'failed',
+                            'error': 'Failed to extract meaningful content'
+                        }
+                    return {
                         'url': url,
-                        'status': 'failed',
-                        'error': str(e)
-                    })
-        
-        return results
+                        'status': 'skipped',
+                        'error': f'Unsupported content type: {content_type}'
+                    }
+                return {
+                    'url': url,
+                    'status': 'failed',
+                    'error': f'HTTP {response.status}'
+                }
+
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {e}")
+            return {
+                'url': url,
+                'status': 'failed',
+                'error': str(e)
+            }
     
     def _extract_content(self, html_content: str, url: str) -> dict:
         """Extract meaningful content from HTML."""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
+            BeautifulSoup, parser, strainer = _get_soup_state()
+            try:
+                soup = BeautifulSoup(html_content, parser, parse_only=strainer)
+            except Exception:
+                # lxml rejects some malformed/XHTML edge cases that the
+                # lenient stdlib parser still handles
+                soup = BeautifulSoup(
+                    html_content, 'html.parser', parse_only=strainer
+                )
+
             # Remove script, style, and other unwanted elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'ads']):
+            for element in soup(_DROP_TAGS):
                 element.decompose()
             
             # Extract title
             title_tag = soup.find('title')
             title = title_tag.get_text().strip() if title_tag else urlparse(url).netloc
             
-            # Try to find main content areas
-            content_selectors = [
-                'main', 'article', '.content', '#content', '.post', '.entry-content',
-                '.article-body', '.story-body', '.post-content', '.entry', '.text'
-            ]
-            
-            content_element = None
-            for selector in content_selectors:
-                content_element = soup.select_one(selector)
-                if content_element:
-                    break
-            
+            # Try to find main content areas: one combined selector walks
+            # the tree once instead of once per candidate
+            content_element = soup.select_one(_CONTENT_SELECTOR)
+
             # If no specific content area found, use body
             if not content_element:
                 content_element = soup.find('body')
@@ -211,9 +473,8 @@ class WebScraperAgentExecutor(AgentExecutor):
             # Extract text content
             content_text = content_element.get_text(separator=' ', strip=True)
             
-            # Clean up the text
-            content_text = re.sub(r'\s+', ' ', content_text)  # Normalize whitespace
-            content_text = content_text.strip()
+            # Normalize whitespace; split/join runs in C and also strips
+            content_text = ' '.join(content_text.split())
             
             # Limit content length
             if len(content_text) > self.max_content_length:
@@ -236,15 +497,25 @@ class WebScraperAgentExecutor(AgentExecutor):
         try:
             # Prepare content for summarization
             content_for_summary = "Web scraping results:\n\n"
-            
+
             successful_scrapes = [r for r in scraped_results if r.get('status') == 'success']
             failed_scrapes = [r for r in scraped_results if r.get('status') != 'success']
-            
+
+            # Split a fixed prompt token budget across the pages (at the
+            # usual ~4 chars/token) so prompt size stays bounded no matter
+            # how many URLs a request carries, instead of growing by a
+            # fixed slice per page
+            if successful_scrapes:
+                per_page_chars = max(
+                    200,
+                    self._prompt_token_budget * 4 // len(successful_scrapes),
+                )
+
             # Add successful scrapes
             for i, result in enumerate(successful_scrapes, 1):
                 content_for_summary += f"{i}. **{result['title']}**\n"
                 content_for_summary += f"   URL: {result['url']}\n"
-                content_for_summary += f"   Content: {result['content'][:1000]}...\n\n"
+                content_for_summary += f"   Content: {result['content'][:per_page_chars]}...\n\n"
             
             # Add failed scrapes summary
             if failed_scrapes:
@@ -268,24 +539,16 @@ Please provide:
 
 Format your response to be clear, informative, and well-structured with appropriate headings."""
 
-            response = await asyncio.to_thread(
-                self.model.completion,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            # Extract the response text
-            if hasattr(response, 'choices') and response.choices:
-                summary = response.choices[0].message.content
-                
-                # Add source information
-                sources_info = "\n\n📋 **Sources:**\n"
-                for i, result in enumerate(successful_scrapes, 1):
-                    sources_info += f"{i}. [{result['title']}]({result['url']})\n"
-                
-                return f"🌐 **Web Content Summary:**\n\n{summary}{sources_info}"
-            else:
-                return self._simple_summary(successful_scrapes)
-                
+            summary = await self._batcher.submit(prompt)
+
+            # Add source information
+            sources_info = "\n\n📋 **Sources:**\n"
+            for i, result in enumerate(successful_scrapes, 1):
+                sources_info += f"{i}. [{result['title']}]({result['url']})\n"
+
+            return f"🌐 **Web Content Summary:**\n\n{summary}{sources_info}"
+
+
         except Exception as e:
             logger.error(f"Error creating summary with Gemini: {e}")
             return self._simple_summary(successful_scrapes)